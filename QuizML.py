@@ -1,15 +1,14 @@
 import sys
-from PyQt6.QtWidgets import QApplication, QMainWindow
-from pathlib import Path
+from PyQt6.QtCore import QCoreApplication, Qt
+from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget
 from code.login_popup import LoginPopup
-from code.dashboard import DashboardApp
-from code.userdata import UserDatabase
-from code.quiz import Quiz
-from code.quiz_gui import QuizApp
-from code.editor import QuestionEditor
-from code.summary import SummaryWindow
+from code.userdata import open_user_database
+from code.question_bank import QUIZ_FILE
+from code.webengine import register_scheme
+from code.startup import StartupWarmer
 
-QUIZ_FILE = Path("data/quizdata.pkl")
+# Dashboard, quiz, oppsummering og editor (med matplotlib, QtWebEngineWidgets og openai)
+# importeres først der de brukes; StartupWarmer laster dem i bakgrunnen mens brukeren logger inn
 
 class MainApp(QMainWindow):
 
@@ -20,16 +19,20 @@ class MainApp(QMainWindow):
         screen = QApplication.primaryScreen().availableGeometry()
         self.resize(int(screen.width() * 0.95), int(screen.height() * 0.95))
 
-        self.user_db = UserDatabase()
+        # Spørsmålsbank, MathJax, QtWebEngine og tunge moduler varmes opp mens login-vinduet venter
+        self.warmer = StartupWarmer().start()
+        self.user_db = self.warmer.timed("user index", open_user_database)
         self.user = None
 
         self.login_popup = LoginPopup(self.user_db)
 
         if self.login_popup.exec():
             self.user = self.login_popup.user
+            self.warmer.warm_question_set(self.user.current_question_set)
         else:
             sys.exit()
-        
+
+        from code.dashboard import DashboardApp
         self.dashboard = DashboardApp(
             self.user,
             self.user_db,
@@ -40,65 +43,81 @@ class MainApp(QMainWindow):
             return_to_login=self.return_to_login
         )
 
-        self.setCentralWidget(self.dashboard)
+        # Dashboardet lever hele økten; oppsummeringer legges over det i stacken og fjernes igjen
+        self.summary_window = None
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.dashboard)
+        self.setCentralWidget(self.stack)
 
     def refresh_dashboard(self):
         self.dashboard.refresh_quiz_list()
         self.dashboard.update_stats()
 
     def start_new_quiz(self, num_questions, show_formulas):
+        from code.quiz import Quiz
+        from code.quiz_gui import QuizApp
+
         quiz_file = self.user.current_question_set or QUIZ_FILE
         quiz = Quiz(num_questions, user_file=None, quiz_file=quiz_file, user=self.user)
 
-        self.quiz_window = QuizApp(quiz, self.user, show_formulas)
+        self.quiz_window = QuizApp(quiz, self.user, show_formulas, user_db=self.user_db)
         self.quiz_window.quiz_completed.connect(self.show_summary_quiz)
         self.quiz_window.show()
         self.hide()
 
-    def retake_quiz(self, quiz, show_formulas):
-        self.quiz_window = QuizApp(quiz, self.user, show_formulas)
+    def retake_quiz(self, attempt, show_formulas):
+        from code.quiz_gui import QuizApp
+
+        quiz = attempt.to_quiz(with_results=False)
+        self.quiz_window = QuizApp(quiz, self.user, show_formulas, user_db=self.user_db)
         self.quiz_window.quiz_completed.connect(self.show_summary_quiz)
         self.quiz_window.show()
         self.hide()
 
-    def show_summary_dashboard(self, quiz):
-        self.dashboard.hide()
-        self.summary_window = SummaryWindow(quiz, return_callback=self.return_from_summary)
-        self.setCentralWidget(self.summary_window)
+    def _show_summary(self, summary_window):
+        self._close_summary()
+        self.summary_window = summary_window
+        self.stack.addWidget(summary_window)
+        self.stack.setCurrentWidget(summary_window)
 
-    def show_summary_quiz(self, quiz):
-        if quiz is None:
-            self.show()
-            self.setCentralWidget(self.dashboard)
-            return
+    def _close_summary(self):
+        if self.summary_window is not None:
+            self.stack.removeWidget(self.summary_window)
+            self.summary_window.deleteLater()
+            self.summary_window = None
 
-        self.user.add_quiz(quiz)
-        self.user_db.save()
+    def show_summary_dashboard(self, attempt):
+        from code.summary import SummaryWindow
+
+        self._show_summary(SummaryWindow(attempt.to_quiz(), return_callback=self.return_from_summary))
+
+    def show_summary_quiz(self, quiz):
+        from code.attempt import QuizAttempt
+        from code.summary import SummaryWindow
 
         self.show()
-        self.summary_window = SummaryWindow(quiz, return_callback=self.return_from_summary)
-        self.setCentralWidget(self.summary_window)
+        # Svarene er journalført underveis i quizen
+        self.dashboard.stats_changed()
+        if quiz is None:
+            self.stack.setCurrentWidget(self.dashboard)
+            return
 
+        self._show_summary(SummaryWindow(quiz, return_callback=self.return_from_summary))
 
+        # Karakteren settes av SummaryWindow, så journalfør quizen etterpå
+        attempt = QuizAttempt.from_quiz(quiz)
+        self.user_db.record_quiz(self.user, attempt)
+        self.dashboard.quiz_added(attempt)
 
     def return_from_summary(self):
-
-        self.dashboard = DashboardApp(
-            self.user,
-            self.user_db,
-            quiz_callback=self.start_new_quiz,
-            retake_callback=self.retake_quiz,
-            edit_callback=self.open_question_editor,
-            summary_callback=self.show_summary_dashboard,
-            return_to_login=self.return_to_login
-        )
-        self.setCentralWidget(self.dashboard)
-        self.refresh_dashboard()
+        self._close_summary()
+        self.stack.setCurrentWidget(self.dashboard)
 
     def return_from_editor(self):
         self.editor_window.close()
         self.show()
-        self.refresh_dashboard()
+        # Spørsmålene (og dermed kategoriene) kan ha endret seg; quizlisten er den samme
+        self.dashboard.rebuild_stats()
 
     def return_to_login(self):
         self.user = None
@@ -106,6 +125,8 @@ class MainApp(QMainWindow):
         self.__init__()
 
     def open_question_editor(self):
+        from code.editor import QuestionEditor
+
         self.editor_window = QuestionEditor(
             return_callback=self.return_from_editor,
             user=self.user,
@@ -116,6 +137,9 @@ class MainApp(QMainWindow):
         self.hide()
 
 if __name__ == "__main__":
+    register_scheme()
+    # Lar QtWebEngineWidgets importeres etter at QApplication finnes
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     window = MainApp()
     window.show()
@@ -0,0 +1,81 @@
+from code.problem import Problem
+from code.question_bank import QUIZ_FILE, get_bank
+from code.quiz import Quiz
+
+
+class QuizAttempt:
+    """Compact record of a finished quiz, stored in User.saved_quizzes.
+
+    Problems are kept as (pid, fingerprint) references into the question bank
+    instead of full Problem objects, results are packed into an int bitmask
+    and shuffle maps into bytes. Problems are looked up again when the
+    summary or a retake needs them; edited or deleted questions are found in
+    the bank's history, and `snapshots` holds the rare problem that could not
+    be found there when the attempt was recorded.
+    """
+
+    def __init__(self, pids, fingerprints, result_bits, num_results, user_answers, shuffled_maps,
+                 date_taken, grade, quiz_file=None, snapshots=None):
+        self.pids = pids
+        self.fingerprints = fingerprints
+        self.result_bits = result_bits
+        self.num_results = num_results
+        self.user_answers = user_answers
+        self.shuffled_maps = shuffled_maps
+        self.date_taken = date_taken
+        self.grade = grade
+        self.quiz_file = quiz_file
+        self.snapshots = snapshots or {}
+
+    @classmethod
+    def from_quiz(cls, quiz):
+        quiz_file = getattr(quiz, "quiz_file", None) or QUIZ_FILE
+        bank = get_bank(quiz_file)
+
+        pids, fingerprints, snapshots = [], [], {}
+        for p in quiz.problems:
+            fingerprint = p.fingerprint()
+            pids.append(p.pid)
+            fingerprints.append(fingerprint)
+            if bank.lookup(p.pid, fingerprint) is None:
+                snapshots[(p.pid, fingerprint)] = p
+
+        result_bits = 0
+        for i, was_correct in enumerate(quiz.results):
+            if was_correct:
+                result_bits |= 1 << i
+
+        shuffled_maps = [bytes(m) for m in getattr(quiz, "shuffled_maps", [])]
+
+        return cls(
+            pids, fingerprints, result_bits, len(quiz.results), list(quiz.user_answers), shuffled_maps,
+            quiz.date_taken, quiz.grade, quiz_file, snapshots
+        )
+
+    @property
+    def results(self):
+        return [bool(self.result_bits >> i & 1) for i in range(self.num_results)]
+
+    @property
+    def num_correct(self):
+        return self.result_bits.bit_count()
+
+    def problems(self):
+        bank = get_bank(self.quiz_file)
+        problems = []
+        for pid, fingerprint in zip(self.pids, self.fingerprints):
+            p = self.snapshots.get((pid, fingerprint)) or bank.lookup(pid, fingerprint)
+            if p is None:
+                p = Problem(pid, "(This question is no longer available)", "", [""] * 5, "_alt1", "")
+            problems.append(p)
+        return problems
+
+    def to_quiz(self, with_results=True):
+        quiz = Quiz.from_problems(self.problems(), quiz_file=self.quiz_file, date_taken=self.date_taken)
+        if with_results:
+            quiz.results = self.results
+            quiz.user_answers = list(self.user_answers)
+            if self.shuffled_maps:
+                quiz.shuffled_maps = [list(m) for m in self.shuffled_maps]
+            quiz.grade = self.grade
+        return quiz
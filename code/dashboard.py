@@ -1,7 +1,7 @@
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListView, QAbstractItemView,
     QMessageBox, QSlider, QSpacerItem, QSizePolicy, QFrame, QStyle, QCheckBox
 )
 
@@ -10,10 +10,11 @@ from code.userdata import User, UserDatabase, UserSettingsPopup
 from code.login_popup import LoginPopup
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
 from datetime import datetime
-import pandas as pd
-from collections import defaultdict
-import pickle
+from code.question_bank import drop_user
+from code.genre_stats import genre_accuracies, needs_rebuild
+from code.quiz_history import QuizHistoryDelegate, QuizHistoryModel, quiz_percent
 from code import __version__
 
 CATEGORY_NAMES = {
@@ -34,6 +35,7 @@ CATEGORY_NAMES = {
 
 GRADE_LIMITS = {90: 'A', 72: 'B', 62: 'C', 48: 'D', 38: 'E', 29: 'F'}
 
+
 class DashboardApp(QWidget):
     def __init__(self, user: User, user_db: UserDatabase, quiz_callback, retake_callback, edit_callback, summary_callback, return_to_login):
         super().__init__()
@@ -70,21 +72,24 @@ class DashboardApp(QWidget):
         title.setAlignment(Qt.AlignmentFlag.AlignLeft)
         left_panel.addWidget(title)
 
-        self.quiz_list = QListWidget()
+        # Modell + delegat: bare synlige rader tegnes, og radteksten lages først når den trengs
+        self.quiz_model = QuizHistoryModel(self)
+        self.quiz_delegate = QuizHistoryDelegate(self)
+        self.quiz_delegate.info_clicked.connect(self._open_summary)
+        self.quiz_list = QListView()
+        self.quiz_list.setModel(self.quiz_model)
+        self.quiz_list.setItemDelegate(self.quiz_delegate)
+        self.quiz_list.setUniformItemSizes(True)
+        self.quiz_list.setMouseTracking(True)
+        self.quiz_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.quiz_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.quiz_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 color: white;
                 font-size: 14pt;
                 border: none;
                 background-color: transparent;
             }
-            QListWidget::item {
-                border-bottom: 1px dashed #8000c8;
-                padding: 8px 4px;
-            }
-            QListWidget::item:selected {
-                background-color: #8000c8;
-            }
         """)
         left_panel.addWidget(self.quiz_list, stretch=1)
         self.refresh_quiz_list()
@@ -193,6 +198,18 @@ class DashboardApp(QWidget):
         self.canvas.setMinimumHeight(200)
         right_panel.addWidget(self.canvas)
 
+        # Aksene og linjen lages én gang; oppdateringer bytter bare ut dataene
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor("black")
+        self.ax.set_ylim(0, 100)
+        self.ax.set_xlabel("Quiz #", color="white")
+        self.ax.set_ylabel("Accuracy (%)", color="white")
+        self.ax.tick_params(axis='x', colors='white')
+        self.ax.tick_params(axis='y', colors='white')
+        # Heltallsmerker i stedet for ett merke per quiz, som blir tregt med tusenvis av quizer
+        self.ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+        self.accuracy_line, = self.ax.plot([], [], color="white", marker="o", linestyle="-", linewidth=2)
+
         stats_and_grade_layout = QHBoxLayout()
 
         self.stats_display = QLabel()
@@ -244,48 +261,22 @@ class DashboardApp(QWidget):
 
 
     def refresh_quiz_list(self):
-        self.quiz_list.clear()
-
-        sorted_quizzes = sorted(self.user.saved_quizzes, key=lambda q: q.date_taken, reverse=True)
-        for idx, quiz in enumerate(sorted_quizzes):
-            percent = round((sum(quiz.results) / len(quiz.results)) * 100) if quiz.results else 0
-            quiz_date = quiz.date_taken.strftime("%d. %B %Y %H:%M") if hasattr(quiz, "date_taken") else "Unknown date"
-            num_questions = len(quiz.results)
-
-            # Container-widget for row
-            widget = QWidget()
-            layout = QHBoxLayout(widget)
-            layout.setContentsMargins(4, 2, 4, 2)
-
-            label = QLabel(f"Quiz {idx + 1} ({percent}%, {quiz.grade}) - {quiz_date} ({num_questions} questions)")
-            label.setStyleSheet("color: white; font-size: 14pt;")
-
-            info_button = QPushButton("ⓘ")
-            info_button.setStyleSheet("""
-                QPushButton {
-                    font-size: 16pt;
-                    color: white;
-                    background-color: transparent;
-                    border: none;
-                    padding-top: 0px;
-                    padding-bottom: 15px;  /* hever knappens innhold litt */
-                }
-                QPushButton:hover {
-                    color: #8000c8;
-                }
-            """)
-
-            info_button.setFixedSize(32, 32)
-            info_button.clicked.connect(lambda _, q=quiz: self._open_summary(q))
-
-            layout.addWidget(label, stretch=1)
-            layout.addWidget(info_button)
-
-            item = QListWidgetItem()
-            item.setSizeHint(widget.sizeHint())
-            self.quiz_list.addItem(item)
-            self.quiz_list.setItemWidget(item, widget)
+        self.quiz_model.set_quizzes(self.user.saved_quizzes)
+
+    # === Inkrementelle oppdateringer ===
+    # MainApp beholder dashboardet hele økten og sier fra om hva som har endret seg
+
+    def quiz_added(self, quiz):
+        self.quiz_model.add_quiz(quiz, len(self.user.saved_quizzes))
+        self._update_grade_and_chart()
+
+    def quiz_deleted(self, quiz, index):
+        # `index` er quizens plass i saved_quizzes før slettingen
+        self.quiz_model.remove_quiz(quiz, index + 1)
+        self._update_grade_and_chart()
 
+    def stats_changed(self):
+        self._update_genre_table()
 
     def _update_slider_label(self, value):
         self.num_problems_label.setText(f"Number of questions: {value}")
@@ -295,26 +286,28 @@ class DashboardApp(QWidget):
         show_formulas = self.show_formulas_checkbox.isChecked()
         self.quiz_callback(num_questions, show_formulas)
 
+    def _selected_quiz(self):
+        # Listen er sortert nyeste først, så raden må slås opp i modellen, ikke i saved_quizzes
+        if not self.quiz_list.selectionModel().hasSelection():
+            return None
+        return self.quiz_model.quiz_at(self.quiz_list.currentIndex().row())
+
     def _retake_selected(self):
-        selected_items = self.quiz_list.selectedItems()
-        if not selected_items:
+        quiz = self._selected_quiz()
+        if quiz is None:
             QMessageBox.warning(self, "Select Quiz", "Please select a quiz to retake.")
             return
-        index = self.quiz_list.currentRow()
-        quiz = self.user.saved_quizzes[index]
         show_formulas = self.show_formulas_checkbox.isChecked()
         self.retake_callback(quiz, show_formulas)
 
     def _delete_selected(self):
-        selected_items = self.quiz_list.selectedItems()
-        if not selected_items:
+        quiz = self._selected_quiz()
+        if quiz is None:
             QMessageBox.warning(self, "Select Quiz", "Please select a quiz to delete.")
             return
-        index = self.quiz_list.currentRow()
-        del self.user.saved_quizzes[index]
-        self.user_db.save()
-        self.refresh_quiz_list()
-        self.update_stats()
+        index = next(i for i, q in enumerate(self.user.saved_quizzes) if q is quiz)
+        self.user_db.delete_quiz(self.user, index)
+        self.quiz_deleted(quiz, index)
 
     def _save_and_quit(self):
         self.user_db.save()
@@ -326,31 +319,24 @@ class DashboardApp(QWidget):
         popup.exec()
 
     def update_stats(self):
-        genre_stats = defaultdict(lambda: {"correct": 0, "total": 0})
-
-        try:
-            with open("data/quizdata.pkl", "rb") as f:
-                problems = pickle.load(f)
-            pid_to_genre = {int(p.pid): str(p.genre) for p in problems}
-        except Exception as e:
-            self.stats_display.setText("Error loading quiz data.")
-            return
-
-        for pid, stat in self.user.question_stats.items():
-            genre = pid_to_genre.get(int(pid))
-            if genre is None:
-                continue
-            genre_stats[genre]["correct"] += stat["correct"]
-            genre_stats[genre]["total"] += stat["correct"] + stat["wrong"]
-
-        results = []
-        for genre, stat in genre_stats.items():
-            if stat["total"] == 0:
-                continue
-            accuracy = round(100 * stat["correct"] / stat["total"])
-            label = CATEGORY_NAMES.get(genre, f"{genre}")
-            results.append((accuracy, label))
-
+        self._update_genre_table()
+        self._update_grade_and_chart()
+
+    def rebuild_stats(self):
+        # Etter endringer i spørsmålssettet (f.eks. i editoren) kan kategoriene ha flyttet seg
+        self.user.genre_stats_set = None
+        self._update_genre_table()
+
+    def _update_genre_table(self):
+        # Kategorisummene holdes oppdatert per svar; her leses de bare (ett oppslag per kategori)
+        if needs_rebuild(self.user):
+            try:
+                self.user_db.rebuild_genre_stats(self.user)
+            except Exception as e:
+                self.stats_display.setText("Error loading quiz data.")
+                return
+
+        results = [(acc, CATEGORY_NAMES.get(genre, f"{genre}")) for acc, genre in genre_accuracies(self.user.genre_stats)]
         results.sort(reverse=True)
         html = "<table style='color:white; font-size:14pt;'>"
         for acc, label in results:
@@ -358,8 +344,9 @@ class DashboardApp(QWidget):
         html += "</table>"
         self.stats_display.setText(html)
 
+    def _update_grade_and_chart(self):
         # === Update Grade Box ===
-        all_accuracies = [round(100 * sum(q.results) / len(q.results)) for q in self.user.saved_quizzes if q.results]
+        all_accuracies = [a for a in map(quiz_percent, self.user.saved_quizzes) if a is not None]
         avg_acc = round(sum(all_accuracies) / len(all_accuracies)) if all_accuracies else 0
         grade = 'F'
         for limit, g in sorted(GRADE_LIMITS.items(), reverse=True):
@@ -369,18 +356,11 @@ class DashboardApp(QWidget):
         self.grade_box.setText(f"<div style='font-size: 12pt;'>Current grade:</div><div style='font-size: 96pt;'>{grade}</div>")
 
         # === Plot quiz accuracy over time ===
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.set_facecolor("black")
-        if all_accuracies:
-            ax.plot(range(1, len(all_accuracies) + 1), all_accuracies, color="white", marker="o", linestyle="-", linewidth=2)
-            ax.set_xticks(range(1, len(all_accuracies) + 1))
-            ax.set_ylim(0, 100)
-            ax.set_xlabel("Quiz #", color="white")
-            ax.set_ylabel("Accuracy (%)", color="white")
-            ax.tick_params(axis='x', colors='white')
-            ax.tick_params(axis='y', colors='white')
-        self.canvas.draw()
+        x = range(1, len(all_accuracies) + 1)
+        self.accuracy_line.set_data(x, all_accuracies)
+        self.ax.set_xlim(0.5, len(all_accuracies) + 0.5)
+        self.ax.set_visible(bool(all_accuracies))
+        self.canvas.draw_idle()
 
     def _reset_statistics(self):
         confirm = QMessageBox.question(
@@ -389,9 +369,9 @@ class DashboardApp(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if confirm == QMessageBox.StandardButton.Yes:
-            self.user.question_stats.clear()
-            self.user_db.save()
-            self.update_stats()
+            self.user_db.reset_stats(self.user)
+            drop_user(self.user.username)
+            self.stats_changed()
             QMessageBox.information(self, "Reset Complete", "All your statistics have been reset.")
 
     def _open_summary(self, quiz):
@@ -5,10 +5,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer
 from pathlib import Path
 from code.problem import Problem
+from code.question_bank import load_problems, save_problems
+from code.render_cache import get_render_cache
 import shutil
-import pickle
 import os
-import pandas as pd
 
 
 class QuestionEditor(QWidget):
@@ -234,25 +234,18 @@ class QuestionEditor(QWidget):
 
     def load_questions(self):
         try:
-            with open(self.pkl_path, "rb") as f:
-                data = pickle.load(f)
-
-            # Sjekk at det er en liste av `Problem`-objekter
-            if not isinstance(data, list) or not all(hasattr(p, "question") and hasattr(p, "alternatives") for p in data):
-                raise ValueError("Wrong file type")
-
-            self.problems = data
+            # Kopi, slik at endringer ikke lekker inn i cachen før de er lagret
+            self.problems = list(load_problems(self.pkl_path))
 
         except Exception as e:
             QMessageBox.critical(self, "Error loading file", f"Could not load file:\n{self.pkl_path}\n\nReason: {str(e)}")
             self.problems = []
             self.pkl_path = "data/quizdata.pkl"
             self.user.current_question_set = self.pkl_path
-            self.user_db.save()
+            self.user_db.update_profile(self.user)
 
     def save_questions(self):
-        with open(self.pkl_path, "wb") as f:
-            pickle.dump(self.problems, f)
+        save_problems(self.pkl_path, self.problems)
 
     def label(self, text):
         l = QLabel(text)
@@ -302,10 +295,9 @@ class QuestionEditor(QWidget):
         p = self.problems[idx]
         self.question_input.setPlainText(p.question)
         self.formula_input.setText(str(p.latex) if isinstance(p.latex, str) else "")
-        corrects = p.correct_alt if isinstance(p.correct_alt, list) else [p.correct_alt]
         for i in range(5):
             self.alt_inputs[i].setText(p.alternatives[i])
-            self.alt_checks[i].setChecked(f"_alt{i+1}" in corrects)
+            self.alt_checks[i].setChecked(i in p.correct_indices)
         # for i in range(5):
         #     self.alt_inputs[i].setText(p.alternatives[i])
         #     self.alt_checks[i].setChecked(p.correct_alt == f"_alt{i+1}")
@@ -328,6 +320,7 @@ class QuestionEditor(QWidget):
         if self.selected_index is None:
             QMessageBox.warning(self, "No selection", "Select a question to delete.")
             return
+        get_render_cache().replace_problem(self.problems[self.selected_index], problems=self.problems)
         del self.problems[self.selected_index]
         self.save_questions()
         self.populate_question_list()
@@ -359,6 +352,8 @@ class QuestionEditor(QWidget):
         new_problem = Problem(pid, question, latex, alts, correct_alt, genre, self.image_filename)
 
         if not is_new:
+            # Fjern rendret matte som ikke lenger brukes av noe spørsmål
+            get_render_cache().replace_problem(self.problems[self.selected_index], new_problem, self.problems)
             self.problems[self.selected_index] = new_problem
         else:
             self.problems.append(new_problem)
@@ -378,6 +373,7 @@ class QuestionEditor(QWidget):
         if not file_path:
             return
         try:
+            import pandas as pd
             df = pd.read_csv(file_path, sep=';')
             imported = []
             for _, row in df.iterrows():
@@ -425,6 +421,7 @@ class QuestionEditor(QWidget):
                     row[f"_alt{i+1}"] = alt
                 data.append(row)
 
+            import pandas as pd
             df = pd.DataFrame(data)
             df.to_csv(file_path, sep=';', index=False)
             QMessageBox.information(self, "Export complete", f"Exported {len(data)} problems to CSV.")
@@ -451,7 +448,7 @@ class QuestionEditor(QWidget):
             if file_path:
                 self.pkl_path = file_path
                 self.user.current_question_set = file_path
-                self.user_db.save()
+                self.user_db.update_profile(self.user)
                 self.update_filename_label()
                 self.load_questions()
                 self.populate_question_list()
@@ -462,7 +459,7 @@ class QuestionEditor(QWidget):
             if file_path:
                 self.pkl_path = file_path
                 self.user.current_question_set = file_path
-                self.user_db.save()
+                self.user_db.update_profile(self.user)
                 self.update_filename_label()
                 self.problems = []
                 self.save_questions()
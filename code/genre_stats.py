@@ -0,0 +1,61 @@
+import time
+from functools import lru_cache
+from pathlib import Path
+from code.question_bank import QUIZ_FILE, get_bank
+
+# Løpende sum per kategori: genre -> {"correct", "total", "last_seen"}.
+# Lagres på brukeren (user.genre_stats) sammen med spørsmålsstatistikken, og
+# user.genre_stats_set sier hvilket spørsmålssett kategoriene er hentet fra.
+# None betyr at summene må bygges på nytt fra question_stats.
+
+
+@lru_cache(maxsize=None)
+def question_set_key(path):
+    return str(Path(path or QUIZ_FILE).resolve())
+
+
+def empty_entry():
+    return {"correct": 0, "total": 0, "last_seen": 0}
+
+
+def record_genre_answer(user, quiz_file, genre, was_correct, now=None):
+    # O(1) per svar; svar fra et annet spørsmålssett enn summene gjelder for telles ikke
+    if user.genre_stats_set is None or user.genre_stats_set != question_set_key(quiz_file):
+        return None
+    entry = user.genre_stats.setdefault(str(genre), empty_entry())
+    if was_correct:
+        entry["correct"] += 1
+    entry["total"] += 1
+    entry["last_seen"] = now if now is not None else time.time()
+    return entry
+
+
+def build_genre_stats(problems, question_stats):
+    pid_to_genre = {int(p.pid): str(p.genre) for p in problems}
+    genre_stats = {}
+    for pid, stat in question_stats.items():
+        genre = pid_to_genre.get(int(pid))
+        if genre is None:
+            continue
+        entry = genre_stats.setdefault(genre, empty_entry())
+        entry["correct"] += stat["correct"]
+        entry["total"] += stat["correct"] + stat["wrong"]
+        entry["last_seen"] = max(entry["last_seen"], stat.get("last_timestamp", 0))
+    return genre_stats
+
+
+def rebuild_genre_stats(user):
+    """Recompute the user's aggregates from question_stats and the current
+    question set. Returns (genre_stats, question set key) without touching
+    the user; the database backends store and apply the result."""
+    bank = get_bank(user.current_question_set)
+    return build_genre_stats(bank.problems, user.question_stats), question_set_key(user.current_question_set)
+
+
+def needs_rebuild(user):
+    return user.genre_stats_set != question_set_key(user.current_question_set)
+
+
+def genre_accuracies(genre_stats):
+    # [(accuracy %, genre)] for kategorier med minst ett svar
+    return [(round(100 * entry["correct"] / entry["total"]), genre) for genre, entry in genre_stats.items() if entry["total"]]
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+HINT_DB = 'data/hints.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hints (
+    key TEXT PRIMARY KEY,
+    pid INTEGER,
+    prompt_version INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    hint TEXT NOT NULL,
+    created REAL NOT NULL
+);
+"""
+
+
+def hint_key(problem, prompt_version, model):
+    # Samme spørsmål (tekst + alternativer) og samme prompt gir samme hint, uansett pid eller spørsmålssett
+    content = json.dumps([prompt_version, model, str(problem.question), [str(a) for a in problem.alternatives]])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class HintStore:
+    """Generated hints on disk, keyed by hint_key().
+
+    One connection shared between threads behind a lock, so hint workers
+    can write results directly.
+    """
+
+    def __init__(self, filepath=HINT_DB):
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def get(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT hint FROM hints WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, hint, pid=None, prompt_version=0, model=""):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO hints (key, pid, prompt_version, model, hint, created) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, pid, prompt_version, model, hint, time.time())
+            )
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM hints").fetchone()[0]
+
+
+_store = None
+
+
+def get_hint_store():
+    global _store
+    if _store is None:
+        _store = HintStore()
+    return _store
@@ -0,0 +1,231 @@
+import html
+import os
+import re
+import threading
+import openai
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from code.hint_store import hint_key
+
+HINT_MODEL = "gpt-4-turbo"
+# Økes når SYSTEM_PROMPT eller build_messages endres, slik at lagrede hint ikke gjenbrukes
+PROMPT_VERSION = 1
+# Sekunder før en hint-forespørsel gis opp
+HINT_TIMEOUT = float(os.getenv("QUIZML_HINT_TIMEOUT", "30"))
+# Pek mot en lokal erstatning, f.eks. python -m code.mock_hint_server
+HINT_BASE_URL = os.getenv("QUIZML_HINT_BASE_URL") or None
+# Vis hintet mens det kommer (QUIZML_HINT_STREAM=0 venter på hele svaret)
+HINT_STREAMING = os.getenv("QUIZML_HINT_STREAM", "1") != "0"
+# Inline-matte i hint: $...$ eller \(...\)
+HINT_MATH_PATTERN = re.compile(r"(\$(?:\\.|[^$\\])+\$|\\\((?:\\.|[^\\])+\\\))")
+
+SYSTEM_PROMPT = (
+    "You are a helpful tutor assisting students with quizzes. "
+    "Briefly show how to identify the correct alternative(s) below. "
+    "Don't state the alternative number(s), as it will be different in the user-output. "
+    "Use clear reasoning or concise mathematical formulas (LaTeX). "
+    "Keep the explanation short (max three sentences). "
+    "Use '**bold**' for important points and '$...$' for inline formulas. Do not use italics."
+)
+
+
+def build_messages(problem):
+    alternatives_text = "\n".join([f"Alternative {i+1}: {alt}" for i, alt in enumerate(problem.alternatives)])
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": (
+            f"{problem.question}\n\n{alternatives_text}\n\n"
+            "Explain briefly how to identify the correct alternative(s)."
+        )},
+    ]
+
+
+def problem_hint_key(problem):
+    return hint_key(problem, PROMPT_VERSION, HINT_MODEL)
+
+
+def save_hint(store, problem, hint_text):
+    store.put(problem_hint_key(problem), hint_text, problem.pid, PROMPT_VERSION, HINT_MODEL)
+
+
+def make_client(api_key, timeout=HINT_TIMEOUT, base_url=HINT_BASE_URL):
+    return openai.OpenAI(api_key=api_key, base_url=base_url, timeout=timeout, max_retries=0)
+
+
+def completion_args(problem):
+    return dict(model=HINT_MODEL, messages=build_messages(problem), temperature=0.2, max_tokens=400)
+
+
+def completion_text(completion):
+    if not completion.choices:
+        raise Exception("No choices returned from API.")
+    return completion.choices[0].message.content.strip()
+
+
+def fetch_hint(client, problem):
+    return completion_text(client.chat.completions.create(**completion_args(problem)))
+
+
+def stream_hint(client, problem):
+    # Gir tekstbitene etter hvert som de kommer
+    stream = client.chat.completions.create(**completion_args(problem), stream=True)
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def fetch_hint_async(client, problem):
+    # client er en openai.AsyncOpenAI; brukes av python -m code.pregenerate_hints
+    return completion_text(await client.chat.completions.create(**completion_args(problem)))
+
+
+def hint_html(content):
+    # Escape hele teksten, slik at HTML blir trygg,
+    # men la spesifikke HTML-tags (som <b>, <i> og <br>) bli gjenopprettet
+    content = html.escape(str(content), quote=False)
+    for tag in ['br', 'b', 'i']:
+        content = content.replace(f"&lt;{tag}&gt;", f"<{tag}>").replace(f"&lt;/{tag}&gt;", f"</{tag}>")
+
+    # Konverter markdown-bold til HTML <b>-tagger
+    content = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', content)
+
+    def replace_math(match):
+        # Unescape matteuttrykket slik at backslashene blir riktig
+        return f"<span class='math'>{html.unescape(match.group(0))}</span>"
+    content = HINT_MATH_PATTERN.sub(replace_math, content)
+
+    return content.replace("\n", "<br>")
+
+
+class HintStreamSplitter:
+    """Splits a streamed hint into pieces that can be formatted on their own.
+
+    feed() returns (done, tail): `done` ends after the last complete
+    sentence or formula with no open $...$, \\(...\\) or **...**, so it
+    can be converted with hint_html() and typeset once; `tail` is the
+    unfinished rest, shown as plain text until more arrives.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, delta):
+        self.buffer += delta
+        cut = self._safe_cut(self.buffer)
+        done, self.buffer = self.buffer[:cut], self.buffer[cut:]
+        return done, self.buffer
+
+    def flush(self):
+        done, self.buffer = self.buffer, ""
+        return done
+
+    @staticmethod
+    def _safe_cut(text):
+        cut = 0
+        in_math = bold = False
+        i = 0
+        while i < len(text):
+            c = text[i]
+            if c == "\\" and i + 1 < len(text):
+                if text[i + 1] == "(" and not in_math:
+                    in_math = True
+                elif text[i + 1] == ")" and in_math:
+                    in_math = False
+                    if not bold:
+                        cut = i + 2
+                i += 2
+                continue
+            if c in "$*" and i + 1 == len(text):
+                # Kan være starten på $$ eller **; vent på neste bit
+                break
+            if c == "$":
+                step = 2 if text.startswith("$$", i) else 1
+                in_math = not in_math
+                if not in_math and not bold:
+                    cut = i + step
+                i += step
+                continue
+            if text.startswith("**", i) and not in_math:
+                bold = not bold
+                i += 2
+                continue
+            if c in ".!?\n" and not in_math and not bold and (c == "\n" or (i + 1 < len(text) and text[i + 1].isspace())):
+                cut = i + 1
+            i += 1
+        return cut
+
+
+class HintSignals(QObject):
+    chunk = pyqtSignal(str)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class HintRequest(QRunnable):
+    """One hint request, run on QThreadPool.globalInstance().
+
+    `cancel()` drops the result and closes the HTTP client so an in-flight
+    request is aborted; signals are never emitted after cancellation.
+    A received hint is written to `store` (if given) even if cancelled.
+    With `stream=True` each piece of text is emitted as `chunk` while the
+    completion is generated, and the full text as `finished` at the end.
+    """
+
+    def __init__(self, problem, api_key, timeout=HINT_TIMEOUT, store=None, stream=False, base_url=HINT_BASE_URL):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.problem = problem
+        self.store = store
+        self.stream = stream
+        self.signals = HintSignals()
+        self.client = make_client(api_key, timeout, base_url)
+        self._cancelled = threading.Event()
+
+    def start(self):
+        QThreadPool.globalInstance().start(self)
+        return self
+
+    def cancel(self):
+        self._cancelled.set()
+        self.client.close()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def _receive(self):
+        if not self.stream:
+            return fetch_hint(self.client, self.problem)
+        parts = []
+        for delta in stream_hint(self.client, self.problem):
+            if self.cancelled:
+                # Et halvt hint skal ikke lagres
+                raise Exception("Hint request cancelled.")
+            parts.append(delta)
+            self.signals.chunk.emit(delta)
+        hint_text = "".join(parts).strip()
+        if not hint_text:
+            raise Exception("Empty hint returned from API.")
+        return hint_text
+
+    def run(self):
+        try:
+            hint_text = self._receive()
+        except openai.APITimeoutError:
+            self._fail("The hint request timed out. Please try again.")
+        except Exception as e:
+            if not self.cancelled:
+                print("API error:", e)
+            self._fail("Hint not received. Please try again.")
+        else:
+            if self.store is not None:
+                try:
+                    save_hint(self.store, self.problem, hint_text)
+                except Exception as e:
+                    # F.eks. låst eller skrivebeskyttet database; hintet vises likevel, det blir bare ikke lagret
+                    print("Could not store hint:", e)
+            if not self.cancelled:
+                self.signals.finished.emit(hint_text)
+
+    def _fail(self, message):
+        if not self.cancelled:
+            self.signals.failed.emit(message)
@@ -0,0 +1,158 @@
+import base64
+import mimetypes
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from PyQt6.QtGui import QImage, QPixmap
+
+IMAGE_DIR = Path("images")
+THUMB_DIR = Path("data/image_cache")
+IMAGE_WIDTH = 400
+# Øvre grense for dekodede bilder i minnet
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+PRESCALE_DPRS = (1.0, 2.0)
+
+
+class ImageService:
+    """Pre-scaled question images, decoded once.
+
+    Images wider than the target are resampled once with Pillow into a PNG
+    thumbnail under THUMB_DIR (rebuilt when the source changes). Decoded
+    QImages and base64 data URIs share one LRU keyed by (kind, name, width,
+    dpr) and bounded by `max_bytes`. QImage is safe to use off the GUI
+    thread, so the prefetcher can fill the cache; `pixmap()` is for the GUI
+    thread only.
+    """
+
+    def __init__(self, image_dir=IMAGE_DIR, thumb_dir=THUMB_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.image_dir = Path(image_dir)
+        self.thumb_dir = Path(thumb_dir)
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # (kind, name, width, dpr) -> (mtime_ns, QImage | str, bytes)
+        self._bytes = 0
+        # Kilder som allerede er smale nok: (name, target) -> mtime_ns, så PIL ikke åpner dem igjen
+        self._small = {}
+        self._lock = threading.Lock()
+
+    def source(self, name):
+        path = self.image_dir / name
+        return path if path.is_file() else None
+
+    def thumbnail_path(self, name, width=IMAGE_WIDTH, dpr=1.0):
+        """Path of an image scaled to width * dpr pixels, or the original
+        if it is not wider than that."""
+        source = self.source(name)
+        if source is None:
+            return None
+        target = int(width * dpr)
+        mtime = source.stat().st_mtime_ns
+        if self._small.get((name, target)) == mtime:
+            return source
+        thumb = self.thumb_dir / f"{source.name}.{target}w.png"
+        if thumb.exists() and thumb.stat().st_mtime_ns >= mtime:
+            return thumb
+
+        from PIL import Image
+
+        with Image.open(source) as img:
+            if img.width <= target:
+                self._small[(name, target)] = mtime
+                return source
+            if img.mode not in ("RGB", "RGBA", "L", "LA"):
+                img = img.convert("RGBA")
+            height = max(1, round(img.height * target / img.width))
+            scaled = img.resize((target, height), Image.Resampling.LANCZOS)
+        thumb.parent.mkdir(parents=True, exist_ok=True)
+        # Prefetch-tråden og GUI-tråden kan lage samme thumbnail samtidig
+        tmp = thumb.with_suffix(f".{threading.get_ident()}.tmp")
+        scaled.save(tmp, format="PNG")
+        tmp.replace(thumb)
+        return thumb
+
+    def _cached(self, key, mtime):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(key)
+                return entry[1]
+        return None
+
+    def _store(self, key, mtime, value, size):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (mtime, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def image(self, name, width=IMAGE_WIDTH, dpr=1.0):
+        source = self.source(name)
+        if source is None:
+            return None
+        key = ("image", name, width, dpr)
+        mtime = source.stat().st_mtime_ns
+        image = self._cached(key, mtime)
+        if image is not None:
+            return image
+
+        image = QImage(str(self.thumbnail_path(name, width, dpr)))
+        if image.isNull():
+            return None
+        image.setDevicePixelRatio(dpr)
+        self._store(key, mtime, image, image.sizeInBytes())
+        return image
+
+    def pixmap(self, name, width=IMAGE_WIDTH, dpr=1.0):
+        image = self.image(name, width, dpr)
+        return QPixmap.fromImage(image) if image is not None else QPixmap()
+
+    def data_uri(self, name, width=IMAGE_WIDTH, dpr=1.0):
+        # Base64-strengen holdes i samme LRU, så et spørsmål som vises igjen ikke leser fra disk
+        source = self.source(name)
+        if source is None:
+            return ""
+        key = ("uri", name, width, dpr)
+        mtime = source.stat().st_mtime_ns
+        uri = self._cached(key, mtime)
+        if uri is not None:
+            return uri
+
+        path = self.thumbnail_path(name, width, dpr)
+        mime = mimetypes.guess_type(path.name)[0] or "image/png"
+        uri = f"data:{mime};base64," + base64.b64encode(path.read_bytes()).decode("ascii")
+        self._store(key, mtime, uri, len(uri))
+        return uri
+
+    def prescale(self, width=IMAGE_WIDTH, dprs=PRESCALE_DPRS):
+        count = 0
+        for path in sorted(self.image_dir.iterdir()):
+            if path.is_file() and not path.name.startswith("."):
+                try:
+                    for dpr in dprs:
+                        self.thumbnail_path(path.name, width, dpr)
+                except OSError as e:
+                    print(f"Skipping {path.name}: {e}")
+                    continue
+                count += 1
+        return count
+
+
+_service = None
+
+
+def get_image_service():
+    global _service
+    if _service is None:
+        _service = ImageService()
+    return _service
+
+
+if __name__ == "__main__":
+    # Lag thumbnails for hele images/: python -m code.image_cache [bredde]
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else IMAGE_WIDTH
+    count = get_image_service().prescale(width)
+    print(f"{count} images pre-scaled to {width}px into {THUMB_DIR}")
@@ -1,7 +1,11 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QHBoxLayout, QMessageBox, QInputDialog, QSizePolicy
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QHBoxLayout, QMessageBox, QInputDialog, QSizePolicy, QProgressBar
+from PyQt6.QtCore import Qt, QTimer
 from code.userdata import User, UserDatabase
-import bcrypt
+from code.passwords import check_password, hash_password, needs_rehash, run_in_worker
+
+# Antall feil passord før innloggingen strupes, og øvre grense for ventetiden
+FREE_ATTEMPTS = 3
+MAX_THROTTLE_SECONDS = 30
 
 class LoginPopup(QDialog):
     def __init__(self, user_db: UserDatabase):
@@ -12,6 +16,9 @@ class LoginPopup(QDialog):
 
         self.user_db = user_db
         self.user = None
+        self.failed_attempts = 0
+        self._busy = False
+        self._throttled = False
 
         layout = QVBoxLayout()
         layout.setSpacing(20)
@@ -86,21 +93,88 @@ class LoginPopup(QDialog):
         button_layout.addWidget(self.login_button)
         layout.addLayout(button_layout)
 
+        # Vises mens bcrypt jobber i bakgrunnen
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setTextVisible(False)
+        self.busy_bar.setFixedHeight(6)
+        self.busy_bar.setStyleSheet("""
+            QProgressBar { background-color: #a050e0; border: none; border-radius: 3px; }
+            QProgressBar::chunk { background-color: white; border-radius: 3px; }
+        """)
+        self.busy_bar.setVisible(False)
+        layout.addWidget(self.busy_bar)
+
         self.setLayout(layout)
 
+    def _set_busy(self, busy):
+        self._busy = busy
+        self.busy_bar.setVisible(busy)
+        for widget in (self.username_entry, self.password_entry, self.signup_button):
+            widget.setEnabled(not busy)
+        self.login_button.setEnabled(not busy and not self._throttled)
+        if busy:
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
+
+    def _register_failure(self):
+        # Ventetiden dobles for hvert nye feilforsøk; QTimer, så dialogen svarer imens
+        self.failed_attempts += 1
+        if self.failed_attempts < FREE_ATTEMPTS:
+            return
+        delay = min(2 ** (self.failed_attempts - FREE_ATTEMPTS), MAX_THROTTLE_SECONDS)
+        self._throttled = True
+        self.login_button.setEnabled(False)
+        self.login_button.setText(f"Wait {delay} s")
+        QTimer.singleShot(delay * 1000, self._end_throttle)
+
+    def _end_throttle(self):
+        self._throttled = False
+        self.login_button.setText("Login")
+        self.login_button.setEnabled(not self._busy)
+
     def login(self):
+        if self._busy or self._throttled:
+            return
         username = self.username_entry.text().strip()
         password = self.password_entry.text().strip().encode()
 
-        user = self.user_db.get_user(username)
-        if not user:
+        # Bare indeksen sjekkes her; hele profilen lastes først etter riktig passord
+        password_hash = self.user_db.password_hash(username)
+        if not password_hash:
             QMessageBox.critical(self, "Error", "No user found.")
             return
 
-        if not bcrypt.checkpw(password, user.password_hash):
+        self._set_busy(True)
+        run_in_worker(
+            check_password, password, password_hash,
+            on_done=lambda ok: self._login_checked(username, password, password_hash, ok)
+        )
+
+    def _login_checked(self, username, password, password_hash, ok):
+        if ok is not True:
+            self._set_busy(False)
+            self._register_failure()
             QMessageBox.critical(self, "Error", "Wrong password.")
             return
 
+        self.failed_attempts = 0
+        user = self.user_db.get_user(username)
+        if needs_rehash(password_hash):
+            # Kostnaden er endret siden hashen ble laget; lag en ny mens vi har passordet
+            run_in_worker(hash_password, password, on_done=lambda new_hash: self._rehashed(user, new_hash))
+            return
+        self._finish_login(user)
+
+    def _rehashed(self, user, new_hash):
+        if isinstance(new_hash, bytes):
+            user.password_hash = new_hash
+            self.user_db.update_profile(user)
+        self._finish_login(user)
+
+    def _finish_login(self, user):
+        self._set_busy(False)
         self.user = user
         self.accept()
 
@@ -116,8 +190,14 @@ class LoginPopup(QDialog):
         if not ok or not name:
             return
 
-        password_hash = bcrypt.hashpw(password, bcrypt.gensalt())
+        self._set_busy(True)
+        run_in_worker(hash_password, password, on_done=lambda password_hash: self._signed_up(name, username, password_hash))
+
+    def _signed_up(self, name, username, password_hash):
+        if not isinstance(password_hash, bytes):
+            self._set_busy(False)
+            QMessageBox.critical(self, "Error", f"Could not create user: {password_hash}")
+            return
         user = User(name=name, username=username, password_hash=password_hash)
         self.user_db.add_user(user)
-        self.user = user
-        self.accept()
+        self._finish_login(user)
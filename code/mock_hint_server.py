@@ -0,0 +1,155 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8765
+CANNED_HINT = (
+    "Look at what the **loss** measures: for a single example it is $L = -\\log p_y$. "
+    "The correct alternative is the one consistent with this."
+)
+
+
+class ChatCompletionsHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for POST /v1/chat/completions.
+
+    Answers every request with CANNED_HINT after `server.delay` seconds.
+    A share `server.fail_rate` of requests gets 429 instead, to exercise
+    retry and backoff in clients. Requests with "stream": true get the hint
+    word by word as server-sent events, `server.token_delay` seconds apart.
+    """
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        self.server.enter()
+        try:
+            self._complete()
+        finally:
+            self.server.leave()
+
+    def _complete(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.server.delay)
+        if random.random() < self.server.fail_rate:
+            self.send_error(429, "Rate limit reached (mock)")
+            return
+
+        if request.get("stream"):
+            self._stream(request)
+            return
+
+        body = json.dumps({
+            "id": f"chatcmpl-mock-{self.server.next_id()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": self.server.hint},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Klienten ga opp (timeout eller avbrutt hint)
+            pass
+
+    def _stream(self, request):
+        completion_id = f"chatcmpl-mock-{self.server.next_id()}"
+
+        def event(delta, finish_reason=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": request.get("model", "mock"),
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(chunk)}\n\n".encode()
+
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            self.wfile.write(event({"role": "assistant", "content": ""}))
+            for word in re.findall(r"\S+\s*", self.server.hint):
+                time.sleep(self.server.token_delay)
+                self.wfile.write(event({"content": word}))
+                self.wfile.flush()
+            self.wfile.write(event({}, "stop"))
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class MockHintServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=DEFAULT_PORT, delay=0.0, hint=CANNED_HINT, verbose=False, fail_rate=0.0,
+                 token_delay=0.03):
+        super().__init__(("127.0.0.1", port), ChatCompletionsHandler)
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.token_delay = token_delay
+        self.hint = hint
+        self.verbose = verbose
+        self.requests = 0
+        # Mottatte forespørsler (også de som får 429), og hvor mange som behandles samtidig
+        self.received = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def next_id(self):
+        with self._lock:
+            self.requests += 1
+            return self.requests
+
+    def enter(self):
+        with self._lock:
+            self.received += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    # QUIZML_HINT_BASE_URL=http://127.0.0.1:8765/v1 python QuizML.py
+    parser = argparse.ArgumentParser(description="Local stand-in for the chat completions endpoint.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait before answering")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--token-delay", type=float, default=0.03, help="seconds between streamed words")
+    args = parser.parse_args()
+
+    server = MockHintServer(args.port, args.delay, verbose=True, fail_rate=args.fail_rate,
+                            token_delay=args.token_delay)
+    print(f"Serving mock hints on {server.base_url}")
+    server.serve_forever()
@@ -0,0 +1,70 @@
+import os
+import bcrypt
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# bcrypt-kostnad (log2 av antall runder). Lavere verdi gir raskere innlogging på trege maskiner;
+# eksisterende hasher oppgraderes/nedgraderes ved neste vellykkede innlogging
+BCRYPT_ROUNDS = int(os.getenv("QUIZML_BCRYPT_ROUNDS", "12"))
+
+
+def _as_bytes(value):
+    return value.encode() if isinstance(value, str) else value
+
+
+def hash_password(password, rounds=BCRYPT_ROUNDS):
+    return bcrypt.hashpw(_as_bytes(password), bcrypt.gensalt(rounds))
+
+
+def check_password(password, password_hash):
+    return bcrypt.checkpw(_as_bytes(password), _as_bytes(password_hash))
+
+
+def hash_rounds(password_hash):
+    # b"$2b$12$..." -> 12
+    try:
+        return int(_as_bytes(password_hash).split(b"$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(password_hash, rounds=BCRYPT_ROUNDS):
+    return hash_rounds(password_hash) != rounds
+
+
+class _TaskSignals(QObject):
+    done = pyqtSignal(object)
+
+
+class _PasswordTask(QRunnable):
+    def __init__(self, func, args):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.func = func
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            result = e
+        self.signals.done.emit(result)
+
+
+# Holder oppgavene i live til de er ferdige, selv om dialogen som startet dem lukkes
+_running = set()
+
+
+def run_in_worker(func, *args, on_done):
+    """Run a bcrypt call on QThreadPool and pass the result (or the
+    exception it raised) to `on_done` on the GUI thread."""
+    task = _PasswordTask(func, args)
+    _running.add(task)
+
+    def finished(result):
+        _running.discard(task)
+        on_done(result)
+
+    task.signals.done.connect(finished)
+    QThreadPool.globalInstance().start(task)
+    return task
@@ -0,0 +1,71 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from code.quiz_page import problem_payload
+
+# Hvor mange spørsmål fremover som gjøres klare mens brukeren svarer
+PREFETCH_DEPTH = int(os.getenv("QUIZML_PREFETCH_DEPTH", "3"))
+
+
+class QuizPrefetcher:
+    """Prepares the next `depth` questions of a quiz on a worker thread.
+
+    For each upcoming question the shuffle map is fixed, math is rendered
+    through the render cache, the image is scaled and the showProblem()
+    payload is built, so advancing only has to hand the payload to the page.
+    At most `depth` prepared questions are held at once; questions that
+    have been shown are dropped.
+    """
+
+    def __init__(self, quiz, show_formulas=True, depth=PREFETCH_DEPTH, dpr=1.0):
+        self.quiz = quiz
+        self.show_formulas = show_formulas
+        self.depth = max(0, depth)
+        self.dpr = dpr
+        self._maps = {}
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quizml-prefetch")
+
+    def shuffled_map(self, idx):
+        # Trekkes i GUI-tråden, slik at rekkefølgen ligger fast før arbeideren begynner
+        if idx not in self._maps:
+            order = list(range(len(self.quiz.get_problem(idx).alternatives)))
+            random.shuffle(order)
+            self._maps[idx] = order
+        return self._maps[idx]
+
+    def _build(self, idx, shuffled_map):
+        problem = self.quiz.get_problem(idx)
+        return problem_payload(problem, shuffled_map, self.show_formulas, token=str(idx), dpr=self.dpr)
+
+    def schedule(self, current_idx):
+        for idx in [i for i in self._pending if i < current_idx]:
+            self._pending.pop(idx).cancel()
+        for idx in [i for i in self._maps if i < current_idx]:
+            del self._maps[idx]
+
+        last = min(current_idx + self.depth, len(self.quiz.problems) - 1)
+        for idx in range(current_idx + 1, last + 1):
+            if idx not in self._pending:
+                self._pending[idx] = self._executor.submit(self._build, idx, self.shuffled_map(idx))
+
+    def take(self, idx):
+        """Payload for question idx, then start preparing the ones after it."""
+        future = self._pending.pop(idx, None)
+        payload = None
+        if future is not None:
+            try:
+                payload = future.result()
+            except Exception as e:
+                print("Prefetch error:", e)
+        if payload is None:
+            # Ikke forhåndshentet (eller arbeideren feilet): bygg det her
+            payload = self._build(idx, self.shuffled_map(idx))
+        self.schedule(idx)
+        return payload
+
+    def close(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
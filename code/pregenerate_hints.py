@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+import openai
+from code.hints import HINT_BASE_URL, HINT_TIMEOUT, fetch_hint_async, problem_hint_key, save_hint
+from code.hint_store import HINT_DB, HintStore
+from code.question_bank import QUIZ_FILE, load_problems
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 2.0  # forespørsler per sekund
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+RETRYABLE = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)
+
+
+class RateLimiter:
+    # Jevnt fordelte starttider: høyst `rate` forespørsler per sekund over alle arbeidere
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def pending_problems(problems, store):
+    """Problems that still need a hint, one per distinct hint key.
+
+    Keys already in the store are skipped, which is what makes an
+    interrupted run resume where it stopped.
+    """
+    seen = set()
+    pending = []
+    for problem in problems:
+        key = problem_hint_key(problem)
+        if key in seen or key in store:
+            continue
+        seen.add(key)
+        pending.append(problem)
+    return pending
+
+
+async def _generate_one(client, problem, limiter, store, stats):
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.wait()
+        try:
+            hint_text = await fetch_hint_async(client, problem)
+        except RETRYABLE as e:
+            if attempt == MAX_RETRIES:
+                print(f"pid {problem.pid}: giving up after {attempt + 1} attempts ({e.__class__.__name__})")
+                stats["failed"] += 1
+                return
+            stats["retries"] += 1
+            # Eksponentiell backoff med jitter
+            await asyncio.sleep(min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0))
+        except Exception as e:
+            print(f"pid {problem.pid}: {e}")
+            stats["failed"] += 1
+            return
+        else:
+            save_hint(store, problem, hint_text)
+            stats["done"] += 1
+            return
+
+
+async def generate_hints(problems, store, api_key, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                         base_url=HINT_BASE_URL, timeout=HINT_TIMEOUT):
+    """Fetch hints for `problems` and write them to `store`.
+
+    At most `concurrency` requests are in flight and at most `rate` are
+    started per second; all of them share one pooled HTTP client.
+    """
+    stats = {"done": 0, "failed": 0, "retries": 0}
+    limiter = RateLimiter(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(problem):
+        async with semaphore:
+            await _generate_one(client, problem, limiter, store, stats)
+
+    async with openai.AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=timeout, max_retries=0) as client:
+        await asyncio.gather(*(worker(p) for p in problems))
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate hints for a question set.")
+    parser.add_argument("quiz_file", nargs="?", default=QUIZ_FILE)
+    parser.add_argument("--store", default=None,
+                        help=f"hint database (default {HINT_DB}; with --mock a temporary file)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="max requests started per second")
+    parser.add_argument("--limit", type=int, default=None, help="only generate this many hints")
+    parser.add_argument("--base-url", default=HINT_BASE_URL)
+    parser.add_argument("--mock", action="store_true", help="run against a local mock endpoint")
+    args = parser.parse_args(argv)
+
+    # Mock-hintene må aldri havne i den ekte databasen: GUI-en ville vist dem, og senere kjøringer hoppet over dem
+    store_path = args.store or HINT_DB
+    if args.mock:
+        if args.store is None:
+            store_path = Path(tempfile.mkdtemp(prefix="quizml-mock-hints-")) / "hints.sqlite"
+        elif Path(args.store).resolve() == Path(HINT_DB).resolve():
+            parser.error(f"--mock cannot write to {HINT_DB}; pass another --store")
+
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    base_url = args.base_url
+    if args.mock:
+        from code.mock_hint_server import MockHintServer
+
+        server = MockHintServer(0, delay=0.2, fail_rate=0.1)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url, api_key = server.base_url, "mock"
+    if not api_key:
+        parser.error("OPENAI_API_KEY is not set")
+
+    store = HintStore(store_path)
+    if args.mock:
+        print(f"Mock run, writing to {store_path}")
+    problems = list(load_problems(args.quiz_file))
+    pending = pending_problems(problems, store)
+    print(f"{len(problems)} questions, {len(pending)} without a stored hint")
+    if args.limit is not None:
+        pending = pending[:args.limit]
+
+    start = time.perf_counter()
+    stats = asyncio.run(generate_hints(pending, store, api_key, args.concurrency, args.rate, base_url))
+    elapsed = time.perf_counter() - start
+    rate = stats["done"] / elapsed if elapsed > 0 else 0.0
+    print(f"{stats['done']} hints in {elapsed:.1f} s ({rate:.2f} hints/s), "
+          f"{stats['retries']} retries, {stats['failed']} failed")
+    return 0 if stats["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
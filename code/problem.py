@@ -1,5 +1,20 @@
+import hashlib
+
+# Feltene som lagres i pickle; samme form som den gamle __dict__-en, så begge veier kan leses
+STATE_FIELDS = ("pid", "question", "latex", "alternatives", "correct_alt", "genre", "image")
+
+
+def parse_alt(alt):
+    # "_alt3" -> 2
+    return int(str(alt).replace("_alt", "")) - 1
+
+
 class Problem:
-    
+    __slots__ = (
+        "pid", "question", "latex", "alternatives", "genre", "image",
+        "_correct_alt", "correct_indices", "correct_mask", "multi_answer",
+    )
+
     def __init__(self, pid, question, latex, alternatives, correct_alt, genre, image=None):
         self.pid = pid
         self.question = question
@@ -9,20 +24,55 @@ class Problem:
         self.genre = genre
         self.image = image
 
+    @property
+    def correct_alt(self):
+        return self._correct_alt
+
+    @correct_alt.setter
+    def correct_alt(self, correct_alt):
+        # Tolk "_altN"-strengene én gang, slik at svarsjekk bare sammenligner indekser
+        self._correct_alt = correct_alt
+        self.multi_answer = isinstance(correct_alt, list)
+        alts = correct_alt if self.multi_answer else [correct_alt]
+        self.correct_indices = tuple(parse_alt(alt) for alt in alts)
+        self.correct_mask = 0
+        for idx in self.correct_indices:
+            self.correct_mask |= 1 << idx
+
+    def __getstate__(self):
+        return {field: getattr(self, field) for field in STATE_FIELDS}
+
+    def __setstate__(self, state):
+        # Gamle pickles har vanlig __dict__; slots-pickles kan komme som (None, slots)
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        state = dict(state)
+        if "_correct_alt" in state:
+            state["correct_alt"] = state.pop("_correct_alt")
+        self.image = None
+        for field in STATE_FIELDS:
+            if field in state:
+                setattr(self, field, state[field])
+
     def get_question(self):
         return self.question
-    
+
     def get_latex(self):
         return self.latex
-    
+
     def get_alts(self):
         return self.alternatives
 
     def get_correct_alt(self):
         return self.correct_alt
-    
+
     def get_genre(self):
         return self.genre
-    
+
     def get_image(self):
-        return self.image
\ No newline at end of file
+        return self.image
+
+    def fingerprint(self):
+        # Kort hash av innholdet, brukt til å se om et lagret forsøk fortsatt matcher spørsmålet
+        content = repr((self.question, self.latex, list(self.alternatives), self.correct_alt, self.genre, self.image))
+        return hashlib.sha1(content.encode()).hexdigest()[:12]
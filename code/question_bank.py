@@ -0,0 +1,187 @@
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+
+QUIZ_FILE = "data/quizdata.pkl"
+# Tidligere versjoner av endrede/slettede spørsmål, slik at gamle quizforsøk kan vises
+HISTORY_SUFFIX = ".history.pkl"
+
+# Prosessvid cache: én QuestionBank per spørsmålssett
+_banks = {}
+_banks_lock = threading.Lock()
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class QuestionBank:
+    """In-memory copy of one pickled question set.
+
+    The set is unpickled once and kept until the file's mtime/size changes.
+    If the stat changes but the content hash is the same (e.g. a touch or a
+    copy), the cached problems are kept and only the signature is updated.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.problems = []
+        self.version = 0
+        self._signature = None
+        self._digest = None
+        self._lock = threading.RLock()
+        # Avledede strukturer per bruker, f.eks. tier-indeksen: {(kind, username): obj}
+        self._derived = {}
+        self._by_fingerprint = None
+        self._history = None
+
+    def _stat_signature(self):
+        st = os.stat(self.path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self):
+        with self._lock:
+            signature = self._stat_signature()
+            if signature == self._signature:
+                return False
+
+            digest = _file_digest(self.path)
+            if digest == self._digest:
+                self._signature = signature
+                return False
+
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+
+            # Sjekk at det er en liste av `Problem`-objekter
+            if not isinstance(data, list) or not all(hasattr(p, "question") and hasattr(p, "alternatives") for p in data):
+                raise ValueError("Wrong file type")
+
+            self._set_problems(data, signature, digest)
+            return True
+
+    def save(self, problems):
+        with self._lock:
+            problems = list(problems)
+            self._archive_replaced(problems)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(problems, f)
+            os.replace(tmp_path, self.path)
+            self._set_problems(problems, self._stat_signature(), _file_digest(self.path))
+
+    @property
+    def history_path(self):
+        return self.path.with_name(self.path.stem + HISTORY_SUFFIX)
+
+    def _load_history(self):
+        if self._history is None:
+            self._history = {}
+            if self.history_path.exists():
+                with open(self.history_path, "rb") as f:
+                    self._history = pickle.load(f)
+        return self._history
+
+    def _archive_replaced(self, problems):
+        # Spørsmål som forsvinner eller endres ved lagring arkiveres under (pid, fingerprint)
+        if not self.problems:
+            return
+        kept = {(p.pid, p.fingerprint()) for p in problems}
+        replaced = {key: p for key, p in self.current_by_fingerprint().items() if key not in kept}
+        if not replaced:
+            return
+        history = self._load_history()
+        history.update(replaced)
+        # Samme atomiske skriving som banken, så et avbrudd ikke etterlater en avkuttet historikk
+        tmp_path = self.history_path.with_name(self.history_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(history, f)
+        os.replace(tmp_path, self.history_path)
+
+    def current_by_fingerprint(self):
+        with self._lock:
+            if self._by_fingerprint is None:
+                self._by_fingerprint = {(p.pid, p.fingerprint()): p for p in self.problems}
+            return self._by_fingerprint
+
+    def lookup(self, pid, fingerprint):
+        # Gjeldende versjon hvis uendret, ellers arkivert versjon, ellers None
+        key = (pid, fingerprint)
+        problem = self.current_by_fingerprint().get(key)
+        if problem is None:
+            problem = self._load_history().get(key)
+        return problem
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+            self._digest = None
+
+    def derived(self, kind, user, factory):
+        # Gjenbruk strukturen så lenge den ble bygget fra den samme stats-dicten
+        with self._lock:
+            key = (kind, user.username)
+            obj = self._derived.get(key)
+            if obj is None or obj.stats is not user.question_stats:
+                obj = self._derived[key] = factory(self.problems, user.question_stats)
+            return obj
+
+    def record_answer(self, user, pid):
+        with self._lock:
+            for (kind, username), obj in self._derived.items():
+                if username == user.username and obj.stats is user.question_stats:
+                    obj.update(pid)
+
+    def drop_user(self, username):
+        with self._lock:
+            for key in [k for k in self._derived if k[1] == username]:
+                del self._derived[key]
+
+    def _set_problems(self, problems, signature, digest):
+        self.problems = problems
+        self._derived = {}
+        self._by_fingerprint = None
+        self._signature = signature
+        self._digest = digest
+        self.version += 1
+
+    def __len__(self):
+        return len(self.problems)
+
+
+def _bank_for(path):
+    path = Path(path or QUIZ_FILE)
+    key = str(path.resolve())
+    with _banks_lock:
+        bank = _banks.get(key)
+        if bank is None:
+            bank = _banks[key] = QuestionBank(path)
+    return bank
+
+
+def get_bank(path=None):
+    bank = _bank_for(path)
+    bank.refresh()
+    return bank
+
+
+def load_problems(path=None):
+    return get_bank(path).problems
+
+
+def save_problems(path, problems):
+    _bank_for(path).save(problems)
+
+
+def drop_user(username):
+    with _banks_lock:
+        banks = list(_banks.values())
+    for bank in banks:
+        bank.drop_user(username)
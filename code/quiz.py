@@ -1,14 +1,37 @@
-import pandas as pd
 import random
 import pickle
 from code.problem import Problem
+from code.question_bank import QUIZ_FILE, get_bank
+from code.genre_stats import record_genre_answer
+from code.tier_index import TierIndex
+from code.scheduler import DueQueue, get_scheduler
 from datetime import datetime
 import time
 from collections import defaultdict
 
+
+def _vector_selector(problems, question_stats):
+    # numpy lastes først når motoren faktisk brukes, ikke ved oppstart
+    from code.vector_selector import VectorSelector
+    return VectorSelector(problems, question_stats)
+
+
+# Utvelgelsesmotorer: "index" vedlikeholder bøttene per svar, "numpy" regner alt vektorisert per quiz
+# "srs" henter de mest forfalte spørsmålene fra repetisjonsplanen (SM-2)
+ENGINES = {
+    "index": TierIndex,
+    "numpy": _vector_selector,
+    "srs": DueQueue,
+}
+DEFAULT_ENGINE = "srs"
+
 class Quiz:
-    def __init__(self, num_problems, user_file=None, quiz_file=None, user=None):
+    def __init__(self, num_problems, user_file=None, quiz_file=None, user=None, engine=DEFAULT_ENGINE):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown selection engine: {engine}")
+
         self.num_problems = num_problems
+        self.engine = engine
         self.user_file = user_file
         self.quiz_file = quiz_file
         self.user = user
@@ -21,93 +44,69 @@ class Quiz:
 
         self._create_quiz()
 
+    @classmethod
+    def from_problems(cls, problems, quiz_file=None, date_taken=None):
+        # Quiz med faste spørsmål (retake/oppsummering), uten ny utvelgelse
+        quiz = cls.__new__(cls)
+        quiz.num_problems = len(problems)
+        quiz.engine = DEFAULT_ENGINE
+        quiz.user_file = None
+        quiz.quiz_file = quiz_file
+        quiz.user = None
+        quiz.genres = list({p.genre for p in problems})
+        quiz.problems = list(problems)
+        quiz.results = []
+        quiz.user_answers = []
+        quiz.date_taken = date_taken or datetime.now()
+        quiz.grade = None
+        return quiz
+
     def _create_quiz(self):
         try:
-            with open("data/quizdata.pkl", "rb") as f:
-                all_problems = pickle.load(f)
+            bank = get_bank(self.quiz_file)
         except Exception as e:
-            raise RuntimeError(f"Failed to load quizdata.pkl: {e}")
-
-        current_time = time.time()
-        ten_days_seconds = 10 * 24 * 3600
-
-        def get_accuracy(pid):
-            stats = self.user.question_stats.get(pid, {"correct": 0, "wrong": 0, "last_timestamp": 0})
-            total = stats["correct"] + stats["wrong"]
-            accuracy = (stats["correct"] / total) if total else 0.5
-            last_timestamp = stats.get("last_timestamp", 0)
-            return accuracy, last_timestamp
-
-        # Kategoriser spørsmål basert på accuracy og tid siden sist sett
-        prioritized, neutral, skipped = [], [], []
-
-        for p in all_problems:
-            accuracy, last_timestamp = get_accuracy(p.pid)
-            time_since_last_seen = current_time - last_timestamp
-
-            if accuracy > 0.8 and time_since_last_seen < ten_days_seconds:
-                skipped.append(p)
-            elif accuracy < 0.6:
-                prioritized.append(p)
-            else:
-                neutral.append(p)
-
-        # Sikre jevn kategorifordeling
-        self.genres = list({p.genre for p in all_problems})
-        random.shuffle(self.genres)
-
-        genre_counts = {genre: 1 for genre in self.genres}
-        remaining = self.num_problems - len(self.genres)
-
-        while remaining > 0:
-            for genre in self.genres:
-                if remaining == 0:
-                    break
-                genre_counts[genre] += 1
-                remaining -= 1
-
-        self.problems = []
-        used_pids = set()
-
-        # Først velg prioriterte
-        for genre in self.genres:
-            genre_problems = [p for p in prioritized if p.genre == genre and p.pid not in used_pids]
-            n = min(len(genre_problems), genre_counts[genre])
-            random.shuffle(genre_problems)
-            selected = genre_problems[:n]
-            used_pids.update(p.pid for p in selected)
-            self.problems.extend(selected)
-            genre_counts[genre] -= len(selected)
-
-        # Så nøytrale spørsmål
-        for genre in self.genres:
-            remaining_slots = genre_counts[genre]
-            if remaining_slots > 0:
-                genre_problems = [p for p in neutral if p.genre == genre and p.pid not in used_pids]
-                n = min(len(genre_problems), remaining_slots)
-                random.shuffle(genre_problems)
-                selected = genre_problems[:n]
-                used_pids.update(p.pid for p in selected)
-                self.problems.extend(selected)
-                genre_counts[genre] -= len(selected)
-
-        # Til slutt spørsmål som tidligere ble hoppet over
-        for genre in self.genres:
-            remaining_slots = genre_counts[genre]
-            if remaining_slots > 0:
-                genre_problems = [p for p in skipped if p.genre == genre and p.pid not in used_pids]
-                n = min(len(genre_problems), remaining_slots)
-                random.shuffle(genre_problems)
-                selected = genre_problems[:n]
-                used_pids.update(p.pid for p in selected)
-                self.problems.extend(selected)
-                genre_counts[genre] -= len(selected)
-
-        # Hvis fortsatt ikke nok spørsmål, fyll tilfeldig
-        if len(self.problems) < self.num_problems:
-            remaining_problems = [p for p in all_problems if p.pid not in used_pids]
-            random.shuffle(remaining_problems)
-            self.problems.extend(remaining_problems[:self.num_problems - len(self.problems)])
+            raise RuntimeError(f"Failed to load {self.quiz_file or QUIZ_FILE}: {e}")
+
+        # Spørsmålene ligger allerede sortert etter sjanger og tier i indeksen,
+        # så utvelgelsen koster O(antall spørsmål i quizen), ikke O(banken)
+        selector = ENGINES[self.engine]
+        if self.engine == "srs":
+            schedule = self.user.schedule if self.user is not None else {}
+
+            def selector(problems, stats):
+                return DueQueue(problems, stats, schedule)
+
+        if self.user is not None:
+            index = bank.derived(self.engine, self.user, selector)
+        else:
+            index = selector(bank.problems, {})
+
+        self.genres, self.problems = index.select(self.num_problems)
+
+    def record_answer(self, user, problem, was_correct):
+        now = time.time()
+        scheduler = get_scheduler()
+        card = user.schedule.get(problem.pid)
+        if card is None:
+            card = scheduler.initial(user.question_stats.get(problem.pid))
+        user.schedule[problem.pid] = scheduler.review(card, was_correct, now)
+
+        stats = user.question_stats.setdefault(problem.pid, {"correct": 0, "wrong": 0, "last_timestamp": 0})
+        if was_correct:
+            stats['correct'] += 1
+        else:
+            stats['wrong'] += 1
+        stats['last_timestamp'] = now
+        record_genre_answer(user, self.quiz_file, problem.genre, was_correct, now)
+
+        get_bank(self.quiz_file).record_answer(user, problem.pid)
+        return stats
+
+    def __getstate__(self):
+        # Brukeren trengs bare for utvelgelsen; ikke dra med hele profilen inn i pickle
+        state = self.__dict__.copy()
+        state["user"] = None
+        return state
 
     def __str__(self):
         return f'IN3310-Quiz. Number of questions: {len(self.problems)} - Number of genres: {len(self.genres)}'
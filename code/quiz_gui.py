@@ -3,31 +3,49 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QRadioButton, QButtonGroup, QMessageBox, QCheckBox,
     QDialog, QTextEdit
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from pathlib import Path
+from PyQt6.QtWebChannel import QWebChannel
 from code.quiz import Quiz
 from code.userdata import User
 from code import __version__
+from code.webengine import APP_URL, mathjax_head, new_view
+from code.render_cache import get_render_cache
+from code.quiz_page import QuizBridge, render_quiz_page
+from code.prefetch import PREFETCH_DEPTH, QuizPrefetcher
+from code.image_cache import IMAGE_WIDTH, get_image_service
+from code.hints import HINT_STREAMING, HintRequest, HintStreamSplitter, hint_html, problem_hint_key
+from code.hint_store import get_hint_store
+from code.startup import TIMING_ENABLED
 import random 
 import time
-import openai
 from dotenv import load_dotenv
 import os
-import re
 import html
+import json
 
 load_dotenv()
 
 LATIN_MODERN = "Latin Modern Roman"
 GRADE_LIMITS = {90: 'A', 72: 'B', 62: 'C', 48: 'D', 38: 'E', 29: 'F'}
+HINT_MATHJAX_CONFIG = {
+    "tex": {"inlineMath": [["$", "$"], ["\\(", "\\)"]]},
+    "svg": {"fontCache": "global"},
+    "options": {"processHtmlClass": "math", "ignoreHtmlClass": "tex2jax_ignore"},
+}
+# "single": hele spørsmålet i én QWebEngineView, "views": én view per tekstfelt (gammel layout)
+RENDER_MODES = ("single", "views")
+DEFAULT_RENDER_MODE = "single"
+# Mål for tiden fra Submit til neste spørsmål er tegnet; QUIZML_TIMING=1 skriver ut målingene
+PAINT_BUDGET_MS = 50
 
 class QuizApp(QWidget):
     quiz_completed = pyqtSignal(object)
 
-    def __init__(self, quiz: Quiz, user: User, show_formulas=True):
+    def __init__(self, quiz: Quiz, user: User, show_formulas=True, user_db=None, render_mode=DEFAULT_RENDER_MODE,
+                 prefetch_depth=PREFETCH_DEPTH):
         super().__init__()
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode: {render_mode}")
 
         screen = QApplication.primaryScreen().availableGeometry()
         self.resize(int(screen.width() * 0.95), int(screen.height() * 0.95))
@@ -36,9 +54,20 @@ class QuizApp(QWidget):
         self.current_idx = 0
         self.username = user.username
         self.user = user
+        self.user_db = user_db
         self.show_formulas = show_formulas
+        self.render_mode = render_mode
 
         self.current_shuffled_map = []  # indeks: posisjon på skjermen → opprinnelig indeks
+        self.selected_indices = []  # valgte posisjoner, rapportert fra siden i single-modus
+        self.option_buttons = []
+        self.paint_times_ms = []  # Submit → neste spørsmål tegnet, i single-modus
+        self._advance_started = None
+        self._page_ready = False
+        self._pending_payload = None
+        self.prefetcher = None
+        self.hint_request = None
+        self.hint_dialog = None
 
         self.setWindowTitle("QuizML")
         self.setStyleSheet("background-color: white;")
@@ -61,19 +90,38 @@ class QuizApp(QWidget):
 
         # === Main question area ===
         self.question_area = QVBoxLayout()
-        self.question_view = QWebEngineView()
-        self.formula_title = QLabel("Use the formula")
-        self.formula_title.setStyleSheet("font-size: 14pt; color: #8000c8;")
-        self.formula_title.setVisible(False)
-        self.formula_view = QWebEngineView()
-        self.image_view = QLabel()
-        self.image_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_view.setStyleSheet("background-color: white;")
-
-        self.question_area.addWidget(self.question_view)
-        self.question_area.addWidget(self.formula_title)
-        self.question_area.addWidget(self.formula_view)
-        main_layout.addLayout(self.question_area, stretch=2)
+        if self.render_mode == "single":
+            # Tekst, formel, bilde og alternativer i én side; valg sendes tilbake over QWebChannel
+            self.page_view = new_view()
+            self.bridge = QuizBridge(self)
+            self.bridge.selection_changed.connect(self._set_selection)
+            self.bridge.submit_requested.connect(self.submit_answer)
+            self.bridge.leave_requested.connect(self.leave_quiz)
+            self.bridge.page_ready.connect(self._on_page_ready)
+            self.bridge.painted.connect(self._on_painted)
+            self.channel = QWebChannel(self.page_view.page())
+            self.channel.registerObject("quizBridge", self.bridge)
+            self.page_view.page().setWebChannel(self.channel)
+            # Neste spørsmål gjøres klare i bakgrunnen mens brukeren svarer på dette
+            self.prefetcher = QuizPrefetcher(quiz, show_formulas, prefetch_depth, dpr=self.devicePixelRatioF())
+            # Siden lastes bare denne ene gangen; load_problem sender JSON til showProblem()
+            self.page_view.setHtml(render_quiz_page(), APP_URL)
+            self.question_area.addWidget(self.page_view)
+            main_layout.addLayout(self.question_area, stretch=1)
+        else:
+            self.question_view = new_view()
+            self.formula_title = QLabel("Use the formula")
+            self.formula_title.setStyleSheet("font-size: 14pt; color: #8000c8;")
+            self.formula_title.setVisible(False)
+            self.formula_view = new_view()
+            self.image_view = QLabel()
+            self.image_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.image_view.setStyleSheet("background-color: white;")
+
+            self.question_area.addWidget(self.question_view)
+            self.question_area.addWidget(self.formula_title)
+            self.question_area.addWidget(self.formula_view)
+            main_layout.addLayout(self.question_area, stretch=2)
 
         # === Answer section ===
         self.bottom_container = QWidget()
@@ -84,10 +132,10 @@ class QuizApp(QWidget):
         self.button_group = QButtonGroup()
         self.answer_widgets = []
 
-        for _ in range(5):
+        for _ in range(5 if self.render_mode == "views" else 0):
             row = QHBoxLayout()
             placeholder = QLabel()  # Dynamisk bytte senere
-            view = QWebEngineView()
+            view = new_view()
             view.setMinimumHeight(30)
             self.answer_widgets.append((placeholder, view, row))
             row.addWidget(placeholder)
@@ -163,7 +211,7 @@ class QuizApp(QWidget):
         # Legg hele layouten inn i bottom_layout til slutt:
         bottom_layout.addLayout(submit_layout)
 
-        main_layout.addWidget(self.bottom_container, stretch=1)
+        main_layout.addWidget(self.bottom_container, stretch=1 if self.render_mode == "views" else 0)
         self.setLayout(main_layout)
         self.load_problem()
 
@@ -172,13 +220,9 @@ class QuizApp(QWidget):
         if not isinstance(content, str):
             content = str(content)
 
-        parts = re.split(r"(\$.*?\$)", content)
-        processed = ""
-        for part in parts:
-            if part.startswith("$") and part.endswith("$"):
-                processed += part
-            else:
-                processed += part.replace("\n", "<br>")
+        # Matte som allerede er rendret til SVG legges rett inn; MathJax lastes bare om noe gjenstår
+        processed, complete = get_render_cache().inline(content, lambda text: text.replace("\n", "<br>"))
+        mathjax = "" if complete else mathjax_head()
 
         return f"""
         <!DOCTYPE html>
@@ -204,16 +248,7 @@ class QuizApp(QWidget):
             overflow: visible !important;
         }}
         </style>
-        <script src='https://polyfill.io/v3/polyfill.min.js?features=es6'></script>
-        <script>
-            window.MathJax = {{
-            tex: {{ inlineMath: [['$','$']] }},
-            svg: {{ fontCache: 'global' }}
-            }};
-        </script>
-        <script type='text/javascript' id='MathJax-script' async
-            src='https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js'>
-        </script>
+        {mathjax}
         </head>
         <body>
         {processed}
@@ -221,36 +256,12 @@ class QuizApp(QWidget):
         </html>
         """
 
-    def render_mathjax_html_hint(self, content):
-        import re
-        import html
-
+    def render_mathjax_html_hint(self, content, tail=""):
         if not isinstance(content, str):
             content = str(content)
 
-        # Escape hele teksten, slik at HTML blir trygg,
-        # men la spesifikke HTML-tags (som <b>, <i> og <br>) bli gjenopprettet
-        content = html.escape(content, quote=False)
-        allowed_tags = ['br', 'b', 'i']
-        for tag in allowed_tags:
-            content = content.replace(f"&lt;{tag}&gt;", f"<{tag}>").replace(f"&lt;/{tag}&gt;", f"</{tag}>")
-
-        # Konverter markdown-bold til HTML <b>-tagger
-        content = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', content)
-        
-        # Bruk et forbedret regex-mønster for å fange inline-matte
-        pattern = re.compile(r"(\$(?:\\.|[^$\\])+\$|\\\((?:\\.|[^\\])+\\\))")
-
-        def replace_math(match):
-            # Unescape matteuttrykket slik at backslashene blir riktig
-            math_expr = html.unescape(match.group(0))
-            return f"<span class='math'>{math_expr}</span>"
-        content = pattern.sub(replace_math, content)
-
-        # Bytt ut nye linjer med <br>
-        content = content.replace("\n", "<br>")
-
-        # Legg også inn et onload-script som tvinger MathJax til å typesette alt når siden er lastet
+        # Legg også inn et onload-script som tvinger MathJax til å typesette alt når siden er lastet.
+        # appendHint() brukes når hintet strømmes: ferdige setninger legges til og typesettes hver for seg
         return f"""
         <!DOCTYPE html>
         <html lang="en">
@@ -271,40 +282,88 @@ class QuizApp(QWidget):
                 display: inline !important;
                 overflow: visible !important;
             }}
+            #hint-tail {{ color: #66a86a; }}
             </style>
-            <script src='https://polyfill.io/v3/polyfill.min.js?features=es6'></script>
-            <script>
-            window.MathJax = {{
-                tex: {{
-                    inlineMath: [['$', '$'], ['\\(', '\\)']]
-                }},
-                svg: {{ fontCache: 'global' }},
-                options: {{
-                    processHtmlClass: 'math',
-                    ignoreHtmlClass: 'tex2jax_ignore'
-                }}
-            }};
-            </script>
-            <script type='text/javascript' id='MathJax-script' async
-                src='https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js'>
-            </script>
+            {mathjax_head(HINT_MATHJAX_CONFIG)}
             <script>
             window.onload = function() {{
                 MathJax.typesetPromise();
             }};
+            function appendHint(html, tail) {{
+                if (html) {{
+                    const span = document.createElement("span");
+                    span.innerHTML = html;
+                    document.getElementById("hint").appendChild(span);
+                    if (window.MathJax && MathJax.startup && MathJax.startup.promise) {{
+                        MathJax.startup.promise.then(() => MathJax.typesetPromise([span]));
+                    }}
+                }}
+                document.getElementById("hint-tail").textContent = tail;
+            }}
             </script>
         </head>
         <body>
-            {content}
+            <span id="hint">{hint_html(content)}</span><span id="hint-tail" class="tex2jax_ignore">{html.escape(tail)}</span>
         </body>
         </html>
         """
 
     def load_problem(self):
+        self.close_hint()
         problem = self.quiz.get_problem(self.current_idx)
-        is_multi = isinstance(problem.correct_alt, list) and len(problem.correct_alt) > 1
+        if self.render_mode == "single":
+            self._load_problem_page(problem)
+        else:
+            self._load_problem_views(problem)
+
+        # === Oppdater statuslinje ===
+        self.right_status.setText(f"Question {self.current_idx + 1} of {len(self.quiz.problems)}")
+        self.problem_id_label.setText(f"pid: {problem.pid}")
+
+    def _shuffle_alternatives(self, problem):
+        indexed_alts = list(enumerate(problem.alternatives))  # (original_index, text)
+        random.shuffle(indexed_alts)
+        self.current_shuffled_map = [idx for idx, _ in indexed_alts]  # ny rekkefølge
+        return indexed_alts
+
+    def _load_problem_page(self, problem):
+        self.current_shuffled_map = self.prefetcher.shuffled_map(self.current_idx)
+        self.selected_indices = []
+        payload = self.prefetcher.take(self.current_idx)
+        if self._page_ready:
+            self.bridge.showProblem.emit(json.dumps(payload))
+        else:
+            self._pending_payload = payload
+        self.page_view.setFocus()
+
+    def _on_page_ready(self):
+        self._page_ready = True
+        if self._pending_payload is not None:
+            self.bridge.showProblem.emit(json.dumps(self._pending_payload))
+            self._pending_payload = None
+
+    def _on_painted(self, token):
+        if self._advance_started is None or token != str(self.current_idx):
+            return
+        elapsed_ms = (time.perf_counter() - self._advance_started) * 1000
+        self._advance_started = None
+        self.paint_times_ms.append(elapsed_ms)
+        if TIMING_ENABLED:
+            over = " (over budget)" if elapsed_ms > PAINT_BUDGET_MS else ""
+            print(f"Question {self.current_idx + 1}: submit → paint {elapsed_ms:.1f} ms{over}")
+
+    def _set_selection(self, indices):
+        self.selected_indices = sorted(indices)
+
+    def _selected_indices(self):
+        if self.render_mode == "single":
+            return list(self.selected_indices)
+        return [i for i, btn in enumerate(self.option_buttons) if btn.isChecked()]
+
+    def _load_problem_views(self, problem):
+        is_multi = len(problem.correct_indices) > 1
         question_html = self.render_mathjax_html(problem.question)
-        self.question_view.setHtml(question_html)
+        self.question_view.setHtml(question_html, APP_URL)
 
         # === Rydd opp i tidligere widgets/layouts ===
         for i in reversed(range(self.question_area.count())):
@@ -322,10 +381,7 @@ class QuizApp(QWidget):
                 self.question_area.removeItem(layout)
 
         # === Shuffle alternativene ===
-        original_alternatives = problem.alternatives
-        indexed_alts = list(enumerate(original_alternatives))  # (original_index, text)
-        random.shuffle(indexed_alts)
-        self.current_shuffled_map = [idx for idx, _ in indexed_alts]  # ny rekkefølge
+        indexed_alts = self._shuffle_alternatives(problem)
 
         # Fjern gamle knapper og views
         for i in reversed(range(self.bottom_container.layout().count() - 1)):
@@ -352,9 +408,9 @@ class QuizApp(QWidget):
             btn.setStyleSheet("color: black;")
             self.option_buttons.append(btn)
 
-            view = QWebEngineView()
+            view = new_view()
             view.setMinimumHeight(40)
-            view.setHtml(self.render_mathjax_html(alt_text))
+            view.setHtml(self.render_mathjax_html(alt_text), APP_URL)
             self.option_views.append(view)
 
             row.addWidget(btn)
@@ -367,15 +423,14 @@ class QuizApp(QWidget):
         self.formula_title.setVisible(show_formula)
         self.formula_view.setVisible(show_formula)
         if show_formula:
-            self.formula_view.setHtml(self.render_mathjax_html(f"$$ {problem.latex} $$"))
+            self.formula_view.setHtml(self.render_mathjax_html(f"$$ {problem.latex} $$"), APP_URL)
         else:
             self.formula_view.setHtml("")
 
 
         if problem.image:
-            image_path = Path("images") / problem.image
-            if image_path.exists():
-                pixmap = QPixmap(str(image_path)).scaledToWidth(400, Qt.TransformationMode.SmoothTransformation)
+            if get_image_service().source(problem.image) is not None:
+                pixmap = get_image_service().pixmap(problem.image, IMAGE_WIDTH, self.devicePixelRatioF())
                 image_label = QLabel()
                 image_label.setPixmap(pixmap)
                 image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -396,36 +451,34 @@ class QuizApp(QWidget):
             if not any(self.question_area.itemAt(i).widget() == self.question_view for i in range(self.question_area.count())):
                 self.question_area.insertWidget(0, self.question_view)
 
-        # === Oppdater statuslinje ===
-        self.right_status.setText(f"Question {self.current_idx + 1} of {len(self.quiz.problems)}")
-        self.problem_id_label.setText(f"pid: {problem.pid}")
-
 
     def submit_answer(self):
         problem = self.quiz.get_problem(self.current_idx)
-        is_multi = isinstance(problem.correct_alt, list)
+        is_multi = problem.multi_answer
 
         # === Hent brukerens valgte svar ===
-        selected_indices = [i for i, btn in enumerate(self.option_buttons) if btn.isChecked()]
+        selected_indices = self._selected_indices()
         if not selected_indices:
             QMessageBox.warning(self, "No selection", "Please select at least one answer.")
             return
 
-        correct_indices = []
+        # Riktige svar som bitmaske over posisjonene på skjermen
+        correct_mask = 0
+        for position, original_idx in enumerate(self.current_shuffled_map):
+            if problem.correct_mask >> original_idx & 1:
+                correct_mask |= 1 << position
+
         if is_multi:
-            correct_indices = [
-                self.current_shuffled_map.index(int(alt.replace("_alt", "")) - 1)
-                for alt in problem.correct_alt
-            ]
+            selected_mask = 0
+            for i in selected_indices:
+                selected_mask |= 1 << i
             # Poeng: +1 for hvert riktig, -1 for hvert feil, min 0
-            correct_selected = len([i for i in selected_indices if i in correct_indices])
-            incorrect_selected = len([i for i in selected_indices if i not in correct_indices])
+            correct_selected = (selected_mask & correct_mask).bit_count()
+            incorrect_selected = (selected_mask & ~correct_mask).bit_count()
             score = max(correct_selected - incorrect_selected, 0)
             was_correct = score > 0
         else:
-            correct_index = int(problem.correct_alt.replace('_alt', '')) - 1
-            correct_after_shuffle = self.current_shuffled_map.index(correct_index)
-            score = 1 if selected_indices[0] == correct_after_shuffle else 0
+            score = 1 if correct_mask >> selected_indices[0] & 1 else 0
             was_correct = score == 1
 
         # === Lagre resultat og brukerens svar ===
@@ -438,35 +491,50 @@ class QuizApp(QWidget):
         self.quiz.shuffled_maps.append(self.current_shuffled_map)
 
         # === Oppdater brukerstatistikk per spørsmål ===
-        pid = problem.pid
-        stats = self.user.question_stats.setdefault(pid, {"correct": 0, "wrong": 0, "last_timestamp": 0})
-        if was_correct:
-            stats['correct'] += 1
-        else:
-            stats['wrong'] += 1
+        self.quiz.record_answer(self.user, problem, was_correct)
+        if self.user_db is not None:
+            self.user_db.record_answer(self.user, problem.pid, problem.genre)
 
         # === Neste spørsmål eller avslutt ===
         self.current_idx += 1
         if self.current_idx < len(self.quiz.problems):
+            self._advance_started = time.perf_counter()
             self.load_problem()
         else:
             self.quiz_completed.emit(self.quiz)
             self.close()
-        stats['last_timestamp'] = time.time()
+
+    def closeEvent(self, event):
+        self.close_hint()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        super().closeEvent(event)
 
     def leave_quiz(self):  
         self.close()
         self.quiz_completed.emit(None)  # Signal til MainApp for å vise dashboard igjen
 
 
+    def _page_has_focus(self):
+        # Tastetrykk går til en intern fokus-proxy under QWebEngineView
+        focused = QApplication.focusWidget()
+        return focused is not None and (focused is self.page_view or self.page_view.isAncestorOf(focused))
+
     def keyPressEvent(self, event):
         key = event.key()
         modifiers = event.modifiers()
 
+        # Har quizsiden fokus, håndterer den 1–5, Enter og Escape selv
+        if self.render_mode == "single" and self._page_has_focus() and (
+                Qt.Key.Key_1 <= key <= Qt.Key.Key_5 or key in (Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Escape)):
+            return
+
         # Toggle alternativ-knapper med tastene 1–5
         if Qt.Key.Key_1 <= key <= Qt.Key.Key_5:
             idx = key - Qt.Key.Key_1
-            if idx < len(self.option_buttons):
+            if self.render_mode == "single":
+                self.page_view.page().runJavaScript(f"toggleOption({idx})")
+            elif idx < len(self.option_buttons):
                 btn = self.option_buttons[idx]
                 btn.setChecked(not btn.isChecked())  # Toggle av/på
 
@@ -484,57 +552,17 @@ class QuizApp(QWidget):
 
 
     def get_hint(self):
-        api_key = os.getenv("OPENAI_API_KEY", "").strip()
-        if not api_key:
-            QMessageBox.warning(
-                self, 
-                "Missing API Key", 
-                "OpenAI API key is missing. Please add it in user settings."
-            )
-            return
-
+        # Bare ett hint om gangen; en tidligere forespørsel avbrytes
+        self.close_hint()
         problem = self.quiz.get_problem(self.current_idx)
-        question_text = problem.question
-        alternatives = problem.alternatives
-        alternatives_text = "\n".join([f"Alternative {i+1}: {alt}" for i, alt in enumerate(alternatives)])
-
-        client = openai.OpenAI(api_key=api_key)
-        try:
-            completion = client.chat.completions.create(
-                model="gpt-4-turbo",
-                messages=[
-                    {"role": "system", "content": (
-                        "You are a helpful tutor assisting students with quizzes. "
-                        "Briefly show how to identify the correct alternative(s) below. "
-                        "Don't state the alternative number(s), as it will be different in the user-output. "
-                        "Use clear reasoning or concise mathematical formulas (LaTeX). "
-                        "Keep the explanation short (max three sentences). "
-                        "Use '**bold**' for important points and '$...$' for inline formulas. Do not use italics."
-                    )},
-                    {"role": "user", "content": (
-                        f"{question_text}\n\n{alternatives_text}\n\n"
-                        "Explain briefly how to identify the correct alternative(s)."
-                    )}
-                ],
-                temperature=0.2,
-                max_tokens=400
-            )
-
-            # Sjekk om svaret inneholder noe
-            if not completion.choices:
-                raise Exception("No choices returned from API.")
-
-            hint_text = completion.choices[0].message.content.strip()
-        except Exception as e:
-            # Logg feilen, og vis fallback-melding i popupen.
-            print("API error:", e)
-            hint_text = "Hint not received. Please try again."
-            # Du kan eventuelt også bruke QMessageBox.warning, men for hint-dialogen kan du vise fallback-tekst.
+        api_key = os.getenv("OPENAI_API_KEY", "").strip()
 
-        hint_text_html = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', hint_text).replace('\n', '<br>')
-        hint_html = self.render_mathjax_html_hint(f'{hint_text_html}')
+        # Hint som er hentet før (også av andre brukere av samme spørsmålsbank) vises rett fra disk
+        cached_hint = get_hint_store().get(problem_hint_key(problem))
+        if cached_hint is None and not self._check_api_key(api_key):
+            return
 
-        # Opprett popup-vindu med Refresh-knapp (hvis nødvendig)
+        # Opprett popup-vindu med Regenerate-knapp
         hint_dialog = QDialog(self)
         hint_dialog.setWindowTitle("Hint from GPT")
         hint_dialog.setMinimumSize(700, 500)
@@ -542,12 +570,13 @@ class QuizApp(QWidget):
 
         layout = QVBoxLayout(hint_dialog)
 
-        # Topp-bar med Refresh- og Close-knapper
+        # Topp-bar med Regenerate- og Close-knapper
         top_bar = QHBoxLayout()
         top_bar.addStretch()
 
-        refresh_button = QPushButton("Refresh")
-        refresh_button.setStyleSheet("""
+        regenerate_button = QPushButton("Regenerate")
+        regenerate_button.setToolTip("Ask for a new hint and replace the saved one")
+        regenerate_button.setStyleSheet("""
             QPushButton {
                 background-color: transparent;
                 color: #4CAF50;
@@ -561,8 +590,7 @@ class QuizApp(QWidget):
                 background-color: #e6f5e9;
             }
         """)
-        refresh_button.clicked.connect(lambda: hint_view.setHtml(hint_html))
-        top_bar.addWidget(refresh_button)
+        top_bar.addWidget(regenerate_button)
 
         close_button = QPushButton("Close")
         close_button.setStyleSheet("""
@@ -582,13 +610,97 @@ class QuizApp(QWidget):
         top_bar.addWidget(close_button)
         layout.addLayout(top_bar)
 
-        # Hint-innhold
-        hint_view = QWebEngineView()
+        hint_view = new_view()
         layout.addWidget(hint_view)
 
-        # Sett inn HTML-innholdet – om det fremdeles er blankt, kan brukeren trykke Refresh.
-        # Vi setter det direkte her:
-        hint_view.setHtml(hint_html)
+        def show_hint(hint_text):
+            hint_view.setHtml(self.render_mathjax_html_hint(hint_text), APP_URL)
+            regenerate_button.setEnabled(True)
+
+        # Strømming: siden lastes én gang, og ferdige biter sendes inn med appendHint()
+        stream = {"loaded": False, "queue": [], "splitter": None}
 
-        hint_dialog.exec()
+        def run_js(script):
+            if stream["loaded"]:
+                hint_view.page().runJavaScript(script)
+            else:
+                stream["queue"].append(script)
+
+        def on_loaded(ok):
+            stream["loaded"] = True
+            for script in stream["queue"]:
+                hint_view.page().runJavaScript(script)
+            stream["queue"].clear()
+
+        def append_chunk(delta):
+            done, tail = stream["splitter"].feed(delta)
+            run_js(f"appendHint({json.dumps(hint_html(done) if done else '')}, {json.dumps(tail)})")
+
+        def finish_stream(hint_text):
+            rest = stream["splitter"].flush()
+            run_js(f"appendHint({json.dumps(hint_html(rest) if rest else '')}, '')")
+            regenerate_button.setEnabled(True)
+
+        hint_view.loadFinished.connect(on_loaded)
+
+        def request_hint():
+            if not self._check_api_key(api_key):
+                return
+            if self.hint_request is not None:
+                self.hint_request.cancel()
+            # Viser en ventetekst til svaret kommer
+            stream["loaded"] = False
+            stream["queue"].clear()
+            stream["splitter"] = HintStreamSplitter()
+            hint_view.setHtml(self.render_mathjax_html_hint("", tail="Fetching hint…"), APP_URL)
+            regenerate_button.setEnabled(False)
+
+            # Forespørselen kjører i QThreadPool; dialogen er ikke-modal, så quizen kan brukes imens.
+            # Svaret lagres i hint-lageret og erstatter et eventuelt tidligere hint
+            request = HintRequest(problem, api_key, store=get_hint_store(), stream=HINT_STREAMING)
+
+            def current(slot):
+                # Signaler som allerede lå i køen fra en avbrutt forespørsel ignoreres
+                return lambda text: slot(text) if self.hint_request is request else None
+
+            if HINT_STREAMING:
+                request.signals.chunk.connect(current(append_chunk))
+                request.signals.finished.connect(current(finish_stream))
+            else:
+                request.signals.finished.connect(current(show_hint))
+            request.signals.failed.connect(current(show_hint))
+            self.hint_request = request.start()
+
+        regenerate_button.clicked.connect(request_hint)
+        if cached_hint is not None:
+            show_hint(cached_hint)
+        else:
+            request_hint()
 
+        hint_dialog.finished.connect(self._hint_closed)
+        self.hint_dialog = hint_dialog
+        hint_dialog.show()
+
+    def _check_api_key(self, api_key):
+        if not api_key:
+            QMessageBox.warning(
+                self, 
+                "Missing API Key", 
+                "OpenAI API key is missing. Please add it in user settings."
+            )
+            return False
+        return True
+
+    def _hint_closed(self):
+        if self.hint_request is not None:
+            self.hint_request.cancel()
+            self.hint_request = None
+        if self.hint_dialog is not None:
+            self.hint_dialog.deleteLater()
+            self.hint_dialog = None
+
+    def close_hint(self):
+        # Kalles også når quizen går videre til neste spørsmål
+        if self.hint_dialog is not None:
+            self.hint_dialog.reject()
+        self._hint_closed()
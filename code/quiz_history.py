@@ -0,0 +1,142 @@
+from PyQt6.QtCore import QAbstractListModel, QEvent, QModelIndex, QRect, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPen
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate
+
+QUIZ_ROLE = Qt.ItemDataRole.UserRole
+ACCENT = QColor("#8000c8")
+INFO_GLYPH = "ⓘ"
+INFO_WIDTH = 32
+ROW_PADDING = 8
+
+
+def quiz_percent(quiz):
+    # Leser bitmasken direkte i stedet for å pakke ut results-listen
+    return round(100 * quiz.num_correct / quiz.num_results) if quiz.num_results else None
+
+
+class QuizHistoryModel(QAbstractListModel):
+    """Saved quizzes, newest first.
+
+    Each row keeps the quiz's number (its position in saved_quizzes, i.e.
+    the order the quizzes were taken) and its label text. The text is
+    built the first time a row is painted and kept until the number
+    changes, so a reset only sorts the attempts.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._quizzes = []
+        self._numbers = []
+        self._texts = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._quizzes)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self._texts[row] is None:
+                self._texts[row] = self._row_text(self._quizzes[row], self._numbers[row])
+            return self._texts[row]
+        if role == QUIZ_ROLE:
+            return self._quizzes[row]
+        return None
+
+    @staticmethod
+    def _row_text(quiz, number):
+        percent = quiz_percent(quiz) or 0
+        quiz_date = quiz.date_taken.strftime("%d. %B %Y %H:%M") if hasattr(quiz, "date_taken") else "Unknown date"
+        return f"Quiz {number} ({percent}%, {quiz.grade}) - {quiz_date} ({quiz.num_results} questions)"
+
+    def quiz_at(self, row):
+        return self._quizzes[row] if 0 <= row < len(self._quizzes) else None
+
+    def set_quizzes(self, saved_quizzes):
+        numbered = sorted(enumerate(saved_quizzes, start=1), key=lambda nq: nq[1].date_taken, reverse=True)
+        self.beginResetModel()
+        self._numbers = [number for number, _ in numbered]
+        self._quizzes = [quiz for _, quiz in numbered]
+        self._texts = [None] * len(numbered)
+        self.endResetModel()
+
+    def add_quiz(self, quiz, number):
+        # Nyeste quiz havner nesten alltid øverst
+        row = next((i for i, q in enumerate(self._quizzes) if q.date_taken < quiz.date_taken), len(self._quizzes))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._quizzes.insert(row, quiz)
+        self._numbers.insert(row, number)
+        self._texts.insert(row, None)
+        self.endInsertRows()
+
+    def remove_quiz(self, quiz, number):
+        row = next(i for i, q in enumerate(self._quizzes) if q is quiz)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._quizzes[row], self._numbers[row], self._texts[row]
+        self.endRemoveRows()
+
+        # Quizer tatt senere rykker ett nummer ned
+        changed = [i for i, n in enumerate(self._numbers) if n > number]
+        for i in changed:
+            self._numbers[i] -= 1
+            self._texts[i] = None
+        if changed:
+            self.dataChanged.emit(self.index(min(changed)), self.index(max(changed)))
+
+
+class QuizHistoryDelegate(QStyledItemDelegate):
+    """Paints one history row: label text, a dashed separator and an ⓘ
+    button on the right. Clicks on the ⓘ emit info_clicked(quiz) instead
+    of selecting the row."""
+
+    info_clicked = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont()
+        self.font.setPointSize(14)
+        self.info_font = QFont()
+        self.info_font.setPointSize(16)
+        self._height = QFontMetrics(self.font).height() + 2 * ROW_PADDING
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self._height)
+
+    @staticmethod
+    def info_rect(rect):
+        return QRect(rect.right() - INFO_WIDTH - 4, rect.top(), INFO_WIDTH, rect.height())
+
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, ACCENT)
+
+        pen = QPen(ACCENT)
+        pen.setStyle(Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        info = self.info_rect(rect)
+        text_rect = rect.adjusted(4 + ROW_PADDING // 2, 0, -(INFO_WIDTH + 8), 0)
+        painter.setFont(self.font)
+        painter.setPen(QColor("white"))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         index.data(Qt.ItemDataRole.DisplayRole))
+
+        hovered = option.state & QStyle.StateFlag.State_MouseOver and not option.state & QStyle.StateFlag.State_Selected
+        painter.setFont(self.info_font)
+        painter.setPen(ACCENT if hovered else QColor("white"))
+        painter.drawText(info, Qt.AlignmentFlag.AlignCenter, INFO_GLYPH)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        # Trefftest mot ⓘ-området; et klikk der åpner oppsummeringen uten å velge raden
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease) \
+                and event.button() == Qt.MouseButton.LeftButton \
+                and self.info_rect(option.rect).contains(event.position().toPoint()):
+            if event.type() == QEvent.Type.MouseButtonRelease:
+                self.info_clicked.emit(index.data(QUIZ_ROLE))
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,213 @@
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from code.image_cache import IMAGE_WIDTH, get_image_service
+from code.render_cache import get_render_cache
+from code.webengine import DEFAULT_MATHJAX_CONFIG, mathjax_head
+
+LATIN_MODERN = "Latin Modern Roman"
+# Siden lastes én gang; MathJax skal bare typesette nodene showProblem bytter ut
+PAGE_MATHJAX_CONFIG = {**DEFAULT_MATHJAX_CONFIG, "startup": {"typeset": False}}
+
+
+class QuizBridge(QObject):
+    # Kanal mellom quiz-siden (JS) og QuizApp
+    showProblem = pyqtSignal(str)  # JSON-payload til siden
+    page_ready = pyqtSignal()
+    painted = pyqtSignal(str)
+    selection_changed = pyqtSignal(list)
+    submit_requested = pyqtSignal()
+    leave_requested = pyqtSignal()
+
+    @pyqtSlot()
+    def ready(self):
+        self.page_ready.emit()
+
+    @pyqtSlot(str)
+    def problemPainted(self, token):
+        self.painted.emit(token)
+
+    @pyqtSlot("QVariantList")
+    def selectionChanged(self, indices):
+        self.selection_changed.emit([int(i) for i in indices])
+
+    @pyqtSlot()
+    def submit(self):
+        self.submit_requested.emit()
+
+    @pyqtSlot()
+    def leave(self):
+        self.leave_requested.emit()
+
+
+def _inline(text):
+    return get_render_cache().inline(str(text), lambda part: part.replace("\n", "<br>"))
+
+
+def problem_payload(problem, shuffled_map, show_formula, token="", dpr=1.0):
+    """Everything showProblem() needs to swap one question into the page.
+
+    Math that is already in the render cache is inlined as SVG; `mathjax`
+    tells the page whether any node still has TeX left for MathJax.
+    """
+    question, complete = _inline(problem.question)
+    needs_mathjax = not complete
+
+    formula = ""
+    if show_formula and problem.latex:
+        formula, complete = _inline(f"$$ {problem.latex} $$")
+        needs_mathjax = needs_mathjax or not complete
+
+    image = get_image_service().data_uri(problem.image, IMAGE_WIDTH, dpr) if problem.image else ""
+
+    options = []
+    for original_idx in shuffled_map:
+        alt_html, complete = _inline(problem.alternatives[original_idx])
+        needs_mathjax = needs_mathjax or not complete
+        options.append(alt_html)
+
+    return {
+        "token": token,
+        "question": question,
+        "formula": formula,
+        "image": image,
+        "inputType": "checkbox" if len(problem.correct_indices) > 1 else "radio",
+        "options": options,
+        "mathjax": needs_mathjax,
+    }
+
+
+def render_quiz_page():
+    """The quiz page shell. Loaded once per QuizApp; questions are pushed in
+    through QuizBridge.showProblem."""
+    return f"""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+        <meta charset="UTF-8">
+        <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+        <style>
+        html, body {{
+            font-family: '{LATIN_MODERN}';
+            font-size: 16pt;
+            color: black;
+            background-color: white;
+            margin: 0;
+            padding: 0;
+        }}
+        .top {{ display: flex; gap: 20px; align-items: flex-start; }}
+        #question {{ flex: 3; }}
+        #image {{ flex: 0 0 auto; }}
+        #image[hidden], #formula-block[hidden] {{ display: none; }}
+        .formula-title {{ font-size: 14pt; color: #8000c8; margin-top: 20px; }}
+        #formula {{ margin: 10px 0; }}
+        #options {{
+            margin-top: 20px;
+            padding: 20px;
+            border: 2px solid #8000c8;
+            border-radius: 8px;
+        }}
+        .option {{ display: flex; align-items: center; gap: 12px; padding: 6px 0; cursor: pointer; }}
+        .option input {{ accent-color: #8000c8; transform: scale(1.3); }}
+        </style>
+        {mathjax_head(PAGE_MATHJAX_CONFIG)}
+        <script>
+            let bridge = null;
+
+            function inputs() {{
+                return Array.from(document.querySelectorAll("input[name='alt']"));
+            }}
+            function reportSelection() {{
+                if (bridge) {{
+                    bridge.selectionChanged(inputs().filter(i => i.checked).map(i => parseInt(i.value)));
+                }}
+            }}
+            function toggleOption(idx) {{
+                const input = inputs()[idx];
+                if (input) {{
+                    input.checked = !input.checked;
+                    reportSelection();
+                }}
+            }}
+
+            function reportPainted(token) {{
+                // To animasjonsrammer: den første kjører før paint, den andre etter
+                requestAnimationFrame(() => requestAnimationFrame(() => bridge.problemPainted(token)));
+            }}
+
+            function typeset(nodes) {{
+                if (!window.MathJax || !MathJax.startup || !MathJax.startup.promise) {{
+                    return Promise.resolve();
+                }}
+                return MathJax.startup.promise.then(() => {{
+                    MathJax.typesetClear(nodes);
+                    return MathJax.typesetPromise(nodes);
+                }});
+            }}
+
+            function showProblem(json) {{
+                const payload = JSON.parse(json);
+                const question = document.getElementById("question");
+                const formula = document.getElementById("formula");
+                const image = document.getElementById("image");
+                const options = document.getElementById("options");
+
+                question.innerHTML = payload.question;
+                formula.innerHTML = payload.formula;
+                document.getElementById("formula-block").hidden = !payload.formula;
+                image.hidden = !payload.image;
+                if (payload.image) {{
+                    image.src = payload.image;
+                }} else {{
+                    image.removeAttribute("src");
+                }}
+
+                options.innerHTML = payload.options.map((alt, position) =>
+                    "<label class='option'>" +
+                    "<input type='" + payload.inputType + "' name='alt' value='" + position + "'>" +
+                    "<span class='alt-text'>" + alt + "</span></label>"
+                ).join("");
+
+                window.scrollTo(0, 0);
+                reportSelection();
+
+                if (payload.mathjax) {{
+                    typeset([question, formula, options]).then(() => reportPainted(payload.token));
+                }} else {{
+                    reportPainted(payload.token);
+                }}
+            }}
+
+            new QWebChannel(qt.webChannelTransport, function(channel) {{
+                bridge = channel.objects.quizBridge;
+                bridge.showProblem.connect(showProblem);
+                bridge.ready();
+            }});
+
+            document.addEventListener("change", reportSelection);
+            // Siden eier 1-5, Enter og Escape; preventDefault hindrer at Qt-vinduet tar dem på nytt
+            document.addEventListener("keydown", function(event) {{
+                if (event.key >= "1" && event.key <= "5") {{
+                    event.preventDefault();
+                    toggleOption(parseInt(event.key) - 1);
+                }} else if (event.key === "Enter") {{
+                    event.preventDefault();
+                    if (bridge) bridge.submit();
+                }} else if (event.key === "Escape") {{
+                    event.preventDefault();
+                    if (bridge) bridge.leave();
+                }}
+            }});
+        </script>
+        </head>
+        <body>
+        <div class='top'>
+            <div id='question'></div>
+            <img id='image' width='{IMAGE_WIDTH}' hidden>
+        </div>
+        <div id='formula-block' hidden>
+            <div class='formula-title'>Use the formula</div>
+            <div id='formula'></div>
+        </div>
+        <form id='options' onsubmit='return false;'></form>
+        </body>
+        </html>
+        """
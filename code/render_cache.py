@@ -0,0 +1,171 @@
+import hashlib
+import io
+import os
+import re
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+CACHE_DIR = Path("data/render_cache")
+# $$...$$ (display) eller $...$ (inline)
+MATH_PATTERN = re.compile(r"(\$\$.+?\$\$|\$[^$]+?\$)", re.DOTALL)
+# Markør for TeX som mathtext ikke kan tegne; de overlates til MathJax i nettleseren
+FAILED = ""
+
+INLINE_SIZE = 16
+DISPLAY_SIZE = 18
+
+
+def split_math(content):
+    # Gir (tekst, None) eller (tex, display) i rekkefølge
+    for part in MATH_PATTERN.split(content):
+        if not part:
+            continue
+        if part.startswith("$$") and part.endswith("$$") and len(part) > 4:
+            yield part[2:-2].strip(), True
+        elif part.startswith("$") and part.endswith("$") and len(part) > 2:
+            yield part[1:-1].strip(), False
+        else:
+            yield part, None
+
+
+class RenderCache:
+    """TeX fragment -> SVG, rendered once with matplotlib mathtext.
+
+    SVGs are stored on disk under a hash of the TeX source and kept in memory
+    once read, so a question is typeset the first time it is seen (or by
+    `python -m code.render_cache`) and inlined as plain SVG after that.
+    Fragments mathtext cannot handle are remembered as failures for the
+    session (not on disk) and left for MathJax to typeset in the page.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def key(self, tex, display):
+        return hashlib.sha256(f"{int(display)}:{tex}".encode()).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.svg"
+
+    def svg(self, tex, display=False):
+        key = self.key(tex, display)
+        svg = self._memory.get(key)
+        if svg is None:
+            path = self._path(key)
+            svg = path.read_text(encoding="utf-8") if path.exists() else None
+            # Tom eller avkappet fil (f.eks. fra en eldre versjon som ikke skrev atomisk): tegn på nytt
+            if not svg or not svg.rstrip().endswith("</svg>"):
+                svg = self._render(tex, display)
+                if svg != FAILED:
+                    self._write(path, svg)
+            self._memory[key] = svg
+        return svg or None
+
+    def _write(self, path, svg):
+        # Temp-fil i samme mappe + os.replace, så en krasj eller en annen tråd aldri ser en halv SVG
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(svg)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _render(self, tex, display):
+        # matplotlib er tungt å importere og ikke trådsikkert; last det først her og tegn én om gangen
+        from matplotlib import mathtext
+        from matplotlib.font_manager import FontProperties
+
+        buffer = io.BytesIO()
+        prop = FontProperties(size=DISPLAY_SIZE if display else INLINE_SIZE)
+        with self._lock:
+            try:
+                mathtext.math_to_image(f"${tex}$", buffer, prop=prop, format="svg")
+            except Exception:
+                return FAILED
+
+        svg = buffer.getvalue().decode("utf-8")
+        return svg[svg.index("<svg"):]
+
+    def inline(self, content, transform_text=None):
+        # Bytt ut matte med ferdig SVG. complete=False betyr at noe fortsatt trenger MathJax
+        parts = []
+        complete = True
+        for text, display in split_math(content):
+            if display is None:
+                parts.append(transform_text(text) if transform_text else text)
+                continue
+
+            svg = self.svg(text, display)
+            if svg is None:
+                complete = False
+                parts.append(f"$${text}$$" if display else f"${text}$")
+            elif display:
+                parts.append(f"<div class='tex-display' style='text-align:center;'>{svg}</div>")
+            else:
+                parts.append(f"<span class='tex-inline' style='display:inline-block;vertical-align:middle;'>{svg}</span>")
+        return "".join(parts), complete
+
+    def fragments(self, problem):
+        texts = [problem.question, *problem.alternatives]
+        fragments = {(tex, display) for text in texts for tex, display in split_math(str(text)) if display is not None}
+        if problem.latex:
+            fragments.add((str(problem.latex).strip(), True))
+        return fragments
+
+    def forget(self, fragments):
+        for tex, display in fragments:
+            key = self.key(tex, display)
+            self._memory.pop(key, None)
+            path = self._path(key)
+            if path.exists():
+                path.unlink()
+
+    def replace_problem(self, old, new=None, problems=()):
+        # Kalles fra editoren: fjern SVG-er for matte som ikke lenger brukes, verken av det nye
+        # spørsmålet eller av de andre i `problems`. Andre spørsmålssett kan dele fragmenter;
+        # de tegnes i så fall bare på nytt neste gang de trengs
+        stale = self.fragments(old)
+        if new is not None:
+            stale -= self.fragments(new)
+        for problem in problems:
+            if not stale:
+                break
+            if problem is not old:
+                stale -= self.fragments(problem)
+        self.forget(stale)
+
+    def prerender(self, problems):
+        rendered = failed = 0
+        for problem in problems:
+            for tex, display in self.fragments(problem):
+                if self.svg(tex, display) is None:
+                    failed += 1
+                else:
+                    rendered += 1
+        return rendered, failed
+
+
+_cache = None
+
+
+def get_render_cache():
+    global _cache
+    if _cache is None:
+        _cache = RenderCache()
+    return _cache
+
+
+if __name__ == "__main__":
+    # Forhåndsrendring av et spørsmålssett: python -m code.render_cache [data/quizdata.pkl]
+    from code.question_bank import QUIZ_FILE, load_problems
+
+    quiz_file = sys.argv[1] if len(sys.argv) > 1 else QUIZ_FILE
+    rendered, failed = get_render_cache().prerender(load_problems(quiz_file))
+    print(f"{rendered} fragments cached as SVG, {failed} left for MathJax")
@@ -0,0 +1,167 @@
+import heapq
+import random
+import time
+from code.tier_index import SKIP_ACCURACY, PRIORITY_ACCURACY, SKIP_SECONDS, genre_quotas
+
+DAY_SECONDS = 24 * 3600
+
+
+class SM2Scheduler:
+    """SuperMemo-2 style scheduling of when a question is due again.
+
+    A card is a small dict {"due", "interval", "ease", "reps"} stored per pid
+    in User.schedule. Correct answers count as quality 4, wrong answers as 1.
+    """
+
+    name = "sm2"
+    min_ease = 1.3
+    start_ease = 2.5
+
+    def initial(self, stats):
+        # Kort for spørsmål som bare har gammel statistikk: følg den gamle
+        # regelen slik at sterke spørsmål hviler ti dager fra sist sett
+        if stats is None:
+            return {"due": 0.0, "interval": 0.0, "ease": self.start_ease, "reps": 0}
+
+        total = stats["correct"] + stats["wrong"]
+        accuracy = (stats["correct"] / total) if total else 0.5
+        last_timestamp = stats.get("last_timestamp", 0)
+        if accuracy > SKIP_ACCURACY:
+            interval = SKIP_SECONDS
+        else:
+            interval = 0.0
+        reps = 1 if accuracy >= PRIORITY_ACCURACY else 0
+        return {"due": last_timestamp + interval, "interval": interval, "ease": self.start_ease, "reps": reps}
+
+    def review(self, card, correct, now=None):
+        now = time.time() if now is None else now
+        quality = 4 if correct else 1
+        ease = card["ease"]
+        reps = card["reps"]
+
+        if quality < 3:
+            reps = 0
+            interval = DAY_SECONDS
+        else:
+            reps += 1
+            if reps == 1:
+                interval = DAY_SECONDS
+            elif reps == 2:
+                interval = 6 * DAY_SECONDS
+            else:
+                interval = max(card["interval"], DAY_SECONDS) * ease
+
+        ease = max(self.min_ease, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        return {"due": now + interval, "interval": interval, "ease": ease, "reps": reps}
+
+
+SCHEDULERS = {
+    "sm2": SM2Scheduler,
+}
+DEFAULT_SCHEDULER = "sm2"
+
+
+def get_scheduler(name=DEFAULT_SCHEDULER):
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler: {name}")
+    return SCHEDULERS[name]()
+
+
+class DueQueue:
+    """Per-genre min-heaps of problems ordered by next due time.
+
+    Building a quiz pops the most overdue problems from each genre heap and
+    pushes them back, so it costs O(k log n). Each entry carries a random
+    tiebreaker after the due time, drawn again whenever it is pushed back,
+    so problems due at the same time (e.g. all unseen ones) come out in a
+    new order every quiz. Answers push a fresh entry for the answered
+    problem; the old entry is skipped lazily when popped.
+    """
+
+    def __init__(self, problems, question_stats, schedule, scheduler=None):
+        self.problems = problems
+        self.stats = question_stats
+        self.schedule = schedule
+        self.scheduler = scheduler or get_scheduler()
+        self.genres = list({p.genre for p in problems})
+        self.heaps = {genre: [] for genre in self.genres}
+        self._genre_sizes = {genre: 0 for genre in self.genres}
+        self._entries = {}
+        self._positions_by_pid = {}
+
+        for idx, p in enumerate(problems):
+            self._positions_by_pid.setdefault(p.pid, []).append(idx)
+            self._genre_sizes[p.genre] += 1
+            entry = self._entries[idx] = (self._due_for(p.pid), random.random(), idx)
+            self.heaps[p.genre].append(entry)
+        for heap in self.heaps.values():
+            heapq.heapify(heap)
+
+    def _due_for(self, pid):
+        card = self.schedule.get(pid)
+        if card is None:
+            card = self.scheduler.initial(self.stats.get(pid))
+        return card["due"]
+
+    def update(self, pid, now=None):
+        for idx in self._positions_by_pid.get(pid, ()):
+            genre = self.problems[idx].genre
+            entry = self._entries[idx] = (self._due_for(pid), random.random(), idx)
+            heap = self.heaps[genre]
+            heapq.heappush(heap, entry)
+
+            # Rydd bort utdaterte oppføringer når de begynner å dominere
+            if len(heap) > 2 * self._genre_sizes[genre] + 16:
+                heap[:] = [e for e in heap if self._entries[e[2]] is e]
+                heapq.heapify(heap)
+
+    def _peek(self, genre):
+        heap = self.heaps[genre]
+        while heap and self._entries[heap[0][2]] is not heap[0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _pop(self, genre):
+        entry = self._peek(genre)
+        if entry is not None:
+            heapq.heappop(self.heaps[genre])
+        return entry
+
+    def select(self, num_problems, genres=None, rng=random, now=None):
+        if genres is None:
+            genres = list(self.genres)
+            rng.shuffle(genres)
+        genre_counts = genre_quotas(genres, num_problems)
+
+        popped = []
+        selected = []
+        used_pids = set()
+
+        def take(genre, slots):
+            while slots > 0:
+                entry = self._pop(genre)
+                if entry is None:
+                    break
+                popped.append((genre, entry))
+                p = self.problems[entry[2]]
+                if p.pid in used_pids:
+                    continue
+                used_pids.add(p.pid)
+                selected.append(p)
+                slots -= 1
+
+        for genre in genres:
+            take(genre, genre_counts[genre])
+
+        # Sjangre med for få spørsmål: fyll opp med de mest forfalte fra resten
+        for genre in genres:
+            if len(selected) >= num_problems:
+                break
+            take(genre, num_problems - len(selected))
+
+        # Ny tiebreaker ved tilbakelegging, så neste quiz trekker likestilte i annen rekkefølge
+        for genre, (due, _, idx) in popped:
+            entry = self._entries[idx] = (due, rng.random(), idx)
+            heapq.heappush(self.heaps[genre], entry)
+
+        return genres, selected
@@ -0,0 +1,182 @@
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from PyQt6.QtCore import QTimer
+from code.question_bank import QUIZ_FILE
+
+# Moduler som ikke trengs før innlogging; lastes i bakgrunnen mens login-vinduet er åpent
+DEFERRED_MODULES = (
+    "code.dashboard",
+    "code.quiz_gui",
+    "code.summary",
+    "code.editor",
+)
+STARTUP_REPORT_FILE = "data/startup_report.jsonl"
+# QUIZML_TIMING=1 skriver ut målinger (oppvarming, submit → paint)
+TIMING_ENABLED = bool(os.getenv("QUIZML_TIMING"))
+
+
+class StartupWarmer:
+    """Warms what the first quiz needs while the login dialog is open.
+
+    A background thread loads the question set, reads the MathJax assets
+    into the scheme handler's cache and imports DEFERRED_MODULES; code that
+    needs one of them just imports it as usual, and the import lock makes
+    it wait for the warmer instead of importing twice. On the GUI thread
+    (from a zero-timer, i.e. inside LoginPopup.exec()) the shared
+    QtWebEngine profile is created and a hidden page loads MathJax, which
+    starts Chromium's render process. Once the user has logged in,
+    warm_question_set() loads their own question set if it is not the
+    default one. `timings` holds (step, seconds, detail) in the order the
+    steps finished.
+    """
+
+    def __init__(self, quiz_file=QUIZ_FILE, modules=DEFERRED_MODULES):
+        self.quiz_file = quiz_file
+        self.modules = modules
+        self.timings = []
+        self.page = None
+        self._thread = threading.Thread(target=self._run, name="quizml-warmer", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        QTimer.singleShot(0, self._warm_webengine)
+        return self
+
+    def record(self, step, start, detail=""):
+        elapsed = time.perf_counter() - start
+        self.timings.append((step, elapsed, detail))
+        if TIMING_ENABLED:
+            print(f"warm {step}: {elapsed * 1000:.1f} ms {detail}".rstrip())
+
+    def timed(self, step, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.record(step, start)
+        return result
+
+    def _warm_bank(self, quiz_file):
+        from code.question_bank import get_bank
+
+        start = time.perf_counter()
+        try:
+            bank = get_bank(quiz_file)
+            self.record("question bank", start, f"{len(bank.problems)} questions from {quiz_file}")
+        except Exception as e:
+            self.record("question bank", start, f"failed: {e}")
+
+    def warm_question_set(self, quiz_file):
+        # Brukeren er kjent først etter innlogging; last brukerens spørsmålssett hvis det ikke er det som ble varmet
+        if Path(quiz_file or QUIZ_FILE).resolve() == Path(self.quiz_file).resolve():
+            return
+        self.quiz_file = quiz_file
+        threading.Thread(target=self._warm_bank, args=(quiz_file,), name="quizml-warmer-bank", daemon=True).start()
+
+    def _run(self):
+        from code.webengine import preload_assets
+
+        self._warm_bank(self.quiz_file)
+
+        start = time.perf_counter()
+        count, size = preload_assets()
+        self.record("mathjax assets", start, f"{count} files, {size / 1024:.0f} kB")
+
+        for name in self.modules:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+                self.record(f"import {name}", start)
+            except Exception as e:
+                self.record(f"import {name}", start, f"failed: {e}")
+
+    def _warm_webengine(self):
+        from PyQt6.QtWebEngineCore import QWebEnginePage
+        from code.webengine import APP_URL, mathjax_head, shared_profile
+
+        start = time.perf_counter()
+        self.page = QWebEnginePage(shared_profile())
+        self.record("webengine profile", start)
+
+        start = time.perf_counter()
+        self.page.loadFinished.connect(
+            lambda ok: self.record("webengine page", start, "MathJax loaded" if ok else "load failed")
+        )
+        # Siden holdes i live, så render-prosessen er varm når første QuizApp åpnes
+        self.page.setHtml(f"<html><head>{mathjax_head()}</head><body>$x$</body></html>", APP_URL)
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def report(self):
+        return "\n".join(f"{step:<28} {elapsed * 1000:8.1f} ms  {detail}" for step, elapsed, detail in self.timings)
+
+
+def _importtime(statement):
+    # Kjører importen i en ny prosess med -X importtime og leser stderr
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nøstede importer er rykket inn ett mellomrom ekstra per nivå
+        modules.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return modules
+
+
+def startup_report(top=15):
+    """Import cost of what runs before the login dialog ("login") and of
+    everything including the deferred modules ("full")."""
+    from code import __version__
+
+    phases = {
+        "login": "import QuizML",
+        "full": "import QuizML; " + "; ".join(f"import {m}" for m in DEFERRED_MODULES),
+    }
+    report = {"version": __version__, "date": datetime.now().isoformat(timespec="seconds"), "phases": {}}
+    for phase, statement in phases.items():
+        modules = _importtime(statement)
+        total_us = sum(self_us for _, self_us, _ in modules)
+        top_level = sorted((m for m in modules if not m[0].startswith(" ")), key=lambda m: -m[2])
+        report["phases"][phase] = {
+            "total_ms": round(total_us / 1000, 1),
+            "modules": len(modules),
+            "top": [(name.strip(), round(cumulative / 1000, 1)) for name, _, cumulative in top_level[:top]],
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report import time at startup (python -X importtime).")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", nargs="?", const=STARTUP_REPORT_FILE, default=None,
+                        help=f"append the report as one JSON line (default {STARTUP_REPORT_FILE})")
+    args = parser.parse_args(argv)
+
+    report = startup_report(args.top)
+    print(f"QuizML {report['version']} startup imports")
+    for phase, data in report["phases"].items():
+        print(f"\n{phase}: {data['total_ms']:.1f} ms over {data['modules']} modules")
+        for name, ms in data["top"]:
+            print(f"  {ms:8.1f} ms  {name}")
+
+    if args.save:
+        with open(args.save, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report) + "\n")
+        print(f"\nAppended to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
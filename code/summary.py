@@ -1,8 +1,9 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtCore import Qt, QUrl, QObject, pyqtSlot
 from PyQt6.QtWebChannel import QWebChannel
 from code.quiz import Quiz
+from code.webengine import APP_URL, mathjax_head, new_view
+from code.render_cache import get_render_cache
 
 LATIN_MODERN = "Latin Modern Roman"
 GRADE_LIMITS = {90: 'A', 72: 'B', 62: 'C', 48: 'D', 38: 'E', 29: 'F'}
@@ -31,7 +32,7 @@ class SummaryWindow(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        self.summary_view = QWebEngineView()
+        self.summary_view = new_view()
         layout.addWidget(self.summary_view)
 
         # WebChannel for connecting JS-button to Python-callback
@@ -41,7 +42,7 @@ class SummaryWindow(QWidget):
         self.summary_view.page().setWebChannel(self.channel)
 
         html = self.render_mathjax_html()
-        self.summary_view.setHtml(html, QUrl(""))
+        self.summary_view.setHtml(html, APP_URL)
 
     def render_mathjax_html(self):
         correct = sum(self.quiz.results)
@@ -54,6 +55,9 @@ class SummaryWindow(QWidget):
                 break
         self.quiz.grade = grade
 
+        render_cache = get_render_cache()
+        needs_mathjax = False
+
         rows = [f"""
             <div class='summary-header'>
                 <div><strong>Quiz Summary</strong></div>
@@ -70,18 +74,15 @@ class SummaryWindow(QWidget):
             qtext = p.question.strip().replace("\n", " ")
             if len(qtext) > 140:
                 qtext = qtext[:140] + "..."
+            qtext, complete = render_cache.inline(qtext)
+            needs_mathjax = needs_mathjax or not complete
             rows.append(f"<p><b>{i+1}. {qtext}</b></p><ul>")
 
             shuffled_map = getattr(self.quiz, "shuffled_maps", [list(range(5))] * len(self.quiz.problems))[i]
             shuffled_alts = [p.alternatives[original_idx] for original_idx in shuffled_map]
 
             # === Hent riktige svar etter shuffling ===
-            if isinstance(p.correct_alt, list):
-                correct_indices = [int(alt.replace("_alt", "")) - 1 for alt in p.correct_alt]
-            else:
-                correct_indices = [int(p.correct_alt.replace("_alt", "")) - 1]
-
-            correct_after_shuffle = [shuffled_map.index(i) for i in correct_indices]
+            correct_after_shuffle = [j for j, original_idx in enumerate(shuffled_map) if p.correct_mask >> original_idx & 1]
 
             user_answer = self.quiz.user_answers[i]
             if not isinstance(user_answer, list):
@@ -94,12 +95,14 @@ class SummaryWindow(QWidget):
                 elif j in user_answer and j not in correct_after_shuffle:
                     symbol = " ❌"
 
-                text = alt_text.strip().replace("\n", " ")
+                text, complete = render_cache.inline(alt_text.strip().replace("\n", " "))
+                needs_mathjax = needs_mathjax or not complete
                 rows.append(f"<li>{j+1}) {text}{symbol}</li>")
 
             rows.append("</ul><div class='divider'></div>")
 
         content = "\n".join(rows)
+        mathjax = mathjax_head() if needs_mathjax else ""
 
         return f"""
         <!DOCTYPE html>
@@ -157,14 +160,7 @@ class SummaryWindow(QWidget):
                 }}
             }}
         </script>
-        <script src='https://polyfill.io/v3/polyfill.min.js?features=es6'></script>
-        <script>
-            window.MathJax = {{
-                tex: {{ inlineMath: [['$','$']] }},
-                svg: {{ fontCache: 'global' }}
-            }};
-        </script>
-        <script async src='https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js'></script>
+        {mathjax}
         </head>
         <body>
         {content}
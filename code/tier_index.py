@@ -0,0 +1,166 @@
+import heapq
+import random
+import time
+
+PRIORITIZED, NEUTRAL, SKIPPED = "prioritized", "neutral", "skipped"
+TIERS = (PRIORITIZED, NEUTRAL, SKIPPED)
+
+SKIP_ACCURACY = 0.8
+PRIORITY_ACCURACY = 0.6
+SKIP_SECONDS = 10 * 24 * 3600
+
+EMPTY_STAT = {"correct": 0, "wrong": 0, "last_timestamp": 0}
+
+
+def get_accuracy(question_stats, pid):
+    stats = question_stats.get(pid, EMPTY_STAT)
+    total = stats["correct"] + stats["wrong"]
+    accuracy = (stats["correct"] / total) if total else 0.5
+    last_timestamp = stats.get("last_timestamp", 0)
+    return accuracy, last_timestamp
+
+
+def classify(accuracy, last_timestamp, now):
+    # Returnerer (tier, tidspunkt der et skippet spørsmål blir nøytralt igjen)
+    if accuracy > SKIP_ACCURACY and now - last_timestamp < SKIP_SECONDS:
+        return SKIPPED, last_timestamp + SKIP_SECONDS
+    if accuracy < PRIORITY_ACCURACY:
+        return PRIORITIZED, None
+    return NEUTRAL, None
+
+
+def genre_quotas(genres, num_problems):
+    genre_counts = {genre: 1 for genre in genres}
+    remaining = num_problems - len(genres)
+
+    while remaining > 0:
+        for genre in genres:
+            if remaining == 0:
+                break
+            genre_counts[genre] += 1
+            remaining -= 1
+
+    return genre_counts
+
+
+class _Bucket:
+    # Liste med O(1) innsetting/fjerning (swap-pop) og O(k) trekking
+    __slots__ = ("items", "positions")
+
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def add(self, idx):
+        self.positions[idx] = len(self.items)
+        self.items.append(idx)
+
+    def remove(self, idx):
+        pos = self.positions.pop(idx)
+        last = self.items.pop()
+        if last != idx:
+            self.items[pos] = last
+            self.positions[last] = pos
+
+    def __len__(self):
+        return len(self.items)
+
+
+class TierIndex:
+    """Genre -> tier -> problems, kept up to date as answers arrive.
+
+    Problems are stored by their position in the bank, so duplicate pids
+    from CSV imports do not collide. Skipped problems become neutral again
+    ten days after they were last seen; those transitions are kept in a
+    heap and applied lazily before each selection.
+    """
+
+    def __init__(self, problems, question_stats, now=None):
+        self.problems = problems
+        self.stats = question_stats
+        self.genres = list({p.genre for p in problems})
+        self.buckets = {genre: {tier: _Bucket() for tier in TIERS} for genre in self.genres}
+        self._tier_of = {}
+        self._skip_until = {}
+        self._expiry = []
+        self._positions_by_pid = {}
+
+        now = time.time() if now is None else now
+        for idx, p in enumerate(problems):
+            self._positions_by_pid.setdefault(p.pid, []).append(idx)
+            skip_until = self._place(idx, now)
+            if skip_until is not None:
+                self._expiry.append((skip_until, idx))
+        heapq.heapify(self._expiry)
+
+    def _place(self, idx, now):
+        p = self.problems[idx]
+        accuracy, last_timestamp = get_accuracy(self.stats, p.pid)
+        tier, skip_until = classify(accuracy, last_timestamp, now)
+        self.buckets[p.genre][tier].add(idx)
+        self._tier_of[idx] = tier
+        if skip_until is not None:
+            self._skip_until[idx] = skip_until
+        return skip_until
+
+    def _move(self, idx, now):
+        p = self.problems[idx]
+        self.buckets[p.genre][self._tier_of[idx]].remove(idx)
+        self._skip_until.pop(idx, None)
+        skip_until = self._place(idx, now)
+        if skip_until is not None:
+            heapq.heappush(self._expiry, (skip_until, idx))
+
+    def _expire(self, now):
+        while self._expiry and self._expiry[0][0] <= now:
+            until, idx = heapq.heappop(self._expiry)
+            # Utdaterte oppføringer (spørsmålet er besvart siden) ignoreres
+            if self._skip_until.get(idx) == until:
+                self._move(idx, now)
+
+    def update(self, pid, now=None):
+        now = time.time() if now is None else now
+        for idx in self._positions_by_pid.get(pid, ()):
+            self._move(idx, now)
+
+    def tier_counts(self):
+        return {
+            genre: {tier: len(bucket) for tier, bucket in tiers.items()}
+            for genre, tiers in self.buckets.items()
+        }
+
+    def select(self, num_problems, genres=None, rng=random, now=None):
+        now = time.time() if now is None else now
+        self._expire(now)
+
+        if genres is None:
+            genres = list(self.genres)
+            rng.shuffle(genres)
+        genre_counts = genre_quotas(genres, num_problems)
+
+        selected = []
+        used_pids = set()
+
+        # Prioriterte først, så nøytrale, til slutt de som ellers hoppes over
+        for tier in TIERS:
+            for genre in genres:
+                remaining_slots = genre_counts[genre]
+                if remaining_slots <= 0:
+                    continue
+                bucket = self.buckets[genre][tier]
+                n = min(len(bucket), remaining_slots)
+                for idx in rng.sample(bucket.items, n):
+                    p = self.problems[idx]
+                    if p.pid in used_pids:
+                        continue
+                    used_pids.add(p.pid)
+                    selected.append(p)
+                    genre_counts[genre] -= 1
+
+        # Hvis fortsatt ikke nok spørsmål, fyll tilfeldig
+        if len(selected) < num_problems:
+            remaining_problems = [p for p in self.problems if p.pid not in used_pids]
+            rng.shuffle(remaining_problems)
+            selected.extend(remaining_problems[:num_problems - len(selected)])
+
+        return genres, selected
@@ -5,14 +5,26 @@ from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton
 from PyQt6.QtCore import Qt
 import time
 import os
+import secrets
+import struct
+import zlib
+from code.genre_stats import rebuild_genre_stats
 
 USERDATA_FILE = 'data/userdata.pkl'
+USERDATA_DIR = 'data/users'
+INDEX_FILE = 'index.pkl'
+JOURNAL_SUFFIX = '.journal'
+# "pickle" (snapshot + journal) eller "sqlite"
+USERDATA_BACKEND = os.getenv('QUIZML_USER_BACKEND', 'pickle')
+# Hver journalpost: lengde og CRC32 av payload, fulgt av payload (pickle)
+JOURNAL_HEADER = struct.Struct('<II')
 
 def default_stat():
     return {'correct': 0, 'wrong': 0}
 
 class User:
-    def __init__(self, name, username, password_hash, saved_quizzes=None, question_stats=None, current_question_set=None):
+    def __init__(self, name, username, password_hash, saved_quizzes=None, question_stats=None, current_question_set=None, schedule=None,
+                 genre_stats=None, genre_stats_set=None):
         self.name = name
         self.username = username
         self.password_hash = password_hash
@@ -21,6 +33,12 @@ class User:
 
         self.current_question_set = current_question_set or "data/quizdata.pkl"
 
+        # Repetisjonsplan per spørsmål: pid -> {"due", "interval", "ease", "reps"}
+        self.schedule = schedule or {}
+
+        # Løpende sum per kategori (se code.genre_stats); genre_stats_set=None betyr "bygg på nytt"
+        self.genre_stats = genre_stats or {}
+        self.genre_stats_set = genre_stats_set
 
         # Use existing stats if populated, or else make new defaultdict
         self.question_stats = (
@@ -41,39 +59,315 @@ class User:
         self.question_stats[pid][2] = time.time()
 
 
+def _fix_legacy_user(user):
+    from code.attempt import QuizAttempt
+
+    if not isinstance(user.question_stats, defaultdict):
+        user.question_stats = defaultdict(default_stat, user.question_stats)
+    if not hasattr(user, "current_question_set"):
+        user.current_question_set = "data/quizdata.pkl"
+    if not hasattr(user, "schedule"):
+        user.schedule = {}
+    if not hasattr(user, "genre_stats"):
+        user.genre_stats = {}
+        user.genre_stats_set = None
+    # Gamle forsøk lagret som hele Quiz-objekter gjøres om til kompakte QuizAttempt
+    user.saved_quizzes = [
+        q if isinstance(q, QuizAttempt) else QuizAttempt.from_quiz(q)
+        for q in user.saved_quizzes
+    ]
+    return user
+
+
+def _write_atomic(path, obj):
+    # Skriv til temp-fil og bytt atomisk, så en krasj aldri etterlater en halv fil
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(obj, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_journal(path):
+    if not path.exists():
+        return []
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    records = []
+    offset = 0
+    while offset + JOURNAL_HEADER.size <= len(data):
+        length, checksum = JOURNAL_HEADER.unpack_from(data, offset)
+        start = offset + JOURNAL_HEADER.size
+        payload = data[start:start + length]
+        # Avkappet eller skadet siste post (krasj under skriving): stopp her
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        records.append(pickle.loads(payload))
+        offset = start + length
+
+    if offset < len(data):
+        with open(path, 'r+b') as f:
+            f.truncate(offset)
+
+    return records
+
+
+def _append_journal(path, record):
+    payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'ab') as f:
+        f.write(JOURNAL_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _apply_record(user, record):
+    kind = record[0]
+
+    if kind == "answer":
+        # Eldre poster mangler kategorisummen; da bygges den på nytt fra question_stats
+        _, _, pid, stats, card, *genre_entry = record
+        user.question_stats[pid] = dict(stats)
+        if card is not None:
+            user.schedule[pid] = dict(card)
+        if genre_entry and genre_entry[0] is not None and hasattr(user, "genre_stats"):
+            genre, entry = genre_entry[0]
+            user.genre_stats[genre] = dict(entry)
+    elif kind == "genre_stats":
+        _, _, genre_stats, question_set = record
+        user.genre_stats = {genre: dict(entry) for genre, entry in genre_stats.items()}
+        user.genre_stats_set = question_set
+    elif kind == "quiz":
+        user.add_quiz(record[2])
+    elif kind == "delete_quiz":
+        del user.saved_quizzes[record[2]]
+    elif kind == "reset_stats":
+        user.question_stats.clear()
+        user.schedule.clear()
+        if hasattr(user, "genre_stats"):
+            user.genre_stats.clear()
+    elif kind == "profile":
+        for attr, value in record[2].items():
+            setattr(user, attr, value)
+
+
+def load_legacy_users(filepath=USERDATA_FILE):
+    # Én samlet userdata.pkl (+ journal) fra før brukerne ble delt i egne filer
+    filepath = Path(filepath)
+    users = {}
+    if filepath.exists():
+        with open(filepath, 'rb') as f:
+            users = pickle.load(f)
+
+    for record in _read_journal(filepath.with_suffix(JOURNAL_SUFFIX)):
+        kind, username = record[0], record[1]
+        if kind == "add_user":
+            users[username] = record[2]
+        elif kind == "delete_user":
+            users.pop(username, None)
+        elif username in users:
+            user = users[username]
+            _apply_record(user, record)
+            if user.username != username:
+                del users[username]
+                users[user.username] = user
+
+    return {username: _fix_legacy_user(user) for username, user in users.items()}
+
+
 class UserDatabase:
-    def __init__(self, filepath=USERDATA_FILE):
-        self.filepath = Path(filepath)
-        self.users = self._load_users()
-
-    def _load_users(self):
-        if self.filepath.exists():
-            with open(self.filepath, 'rb') as f:
-                self.users = pickle.load(f)
-            
-            for user in self.users.values():
-                if not isinstance(user.question_stats, defaultdict):
-                    user.question_stats = defaultdict(default_stat, user.question_stats)
-                if not hasattr(user, "current_question_set"):
-                    user.current_question_set = "data/quizdata.pkl"
-        else:
-            self.users = {}
-            
-        return self.users
-    
+    """One pickle shard per user, plus an append-only journal per shard.
+
+    A small index (username -> shard name and password hash) is all that is
+    read at startup, so login checks never unpickle a profile; a user's shard
+    is loaded by get_user() once the password has been verified.
+
+    Every change (answered question, finished quiz, profile edit, ...) is
+    appended to the user's journal as a small checksummed record, so a change
+    costs the same regardless of how much history the user has. Journals are
+    folded into new snapshots by save(), or automatically once one grows past
+    COMPACT_RECORDS. Snapshots and the index are written to a temp file and
+    renamed, so a crash can at worst lose the record being appended. Each
+    snapshot carries a generation number and each journal starts with the
+    generation it continues, so a journal left behind by a crash during
+    compaction is recognised and not replayed twice.
+    """
+
+    COMPACT_RECORDS = 500
+
+    def __init__(self, dirpath=USERDATA_DIR, legacy_file=USERDATA_FILE):
+        self.dirpath = Path(dirpath)
+        self.index_path = self.dirpath / INDEX_FILE
+        self.users = {}
+        self.journal_records = {}
+
+        if not self.index_path.exists() and legacy_file:
+            self._migrate_legacy(legacy_file)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        if self.index_path.exists():
+            with open(self.index_path, 'rb') as f:
+                return pickle.load(f)
+        return {}
+
+    def _migrate_legacy(self, legacy_file):
+        legacy_file = Path(legacy_file)
+        if not legacy_file.exists() and not legacy_file.with_suffix(JOURNAL_SUFFIX).exists():
+            return
+
+        self.index = {}
+        for user in load_legacy_users(legacy_file).values():
+            self._create_shard(user)
+        self._write_index()
+
+    def _shard_path(self, username, suffix='.pkl'):
+        return self.dirpath / (self.index[username]["shard"] + suffix)
+
+    def _write_index(self):
+        _write_atomic(self.index_path, self.index)
+
+    def _create_shard(self, user):
+        self.index[user.username] = {
+            "shard": secrets.token_hex(8),
+            "password_hash": user.password_hash,
+        }
+        _write_atomic(self._shard_path(user.username), user)
+        self.users[user.username] = user
+        self.journal_records[user.username] = 0
+
+    def _load_user(self, username):
+        with open(self._shard_path(username), 'rb') as f:
+            user = pickle.load(f)
+
+        journal_path = self._shard_path(username, JOURNAL_SUFFIX)
+        records = _read_journal(journal_path)
+        generation = 0
+        if records and records[0][0] == "generation":
+            generation = records.pop(0)[2]
+        if generation < getattr(user, "journal_generation", 0):
+            # Krasj mellom ny snapshot og sletting av journalen: postene er allerede med i snapshoten
+            journal_path.unlink(missing_ok=True)
+            records = []
+        for record in records:
+            _apply_record(user, record)
+        user = _fix_legacy_user(user)
+        user.username = username
+        self.journal_records[username] = len(records)
+        return user
+
+    def _append(self, user, record):
+        _apply_record(user, record)
+        journal_path = self._shard_path(user.username, JOURNAL_SUFFIX)
+        if not journal_path.exists():
+            # Ny journal starter med snapshotens generasjon, så _load_user kjenner igjen en journal som er foldet inn
+            _append_journal(journal_path, ("generation", user.username, getattr(user, "journal_generation", 0)))
+        _append_journal(journal_path, record)
+        self.journal_records[user.username] = self.journal_records.get(user.username, 0) + 1
+
+        if self.journal_records[user.username] >= self.COMPACT_RECORDS:
+            self._compact(user.username)
+
+    def _compact(self, username):
+        # Snapshoten får en ny generasjon før journalen slettes; journaler fra eldre generasjoner hoppes over
+        user = self.users[username]
+        user.journal_generation = getattr(user, "journal_generation", 0) + 1
+        _write_atomic(self._shard_path(username), user)
+        journal_path = self._shard_path(username, JOURNAL_SUFFIX)
+        if journal_path.exists():
+            journal_path.unlink()
+        self.journal_records[username] = 0
+
     def save(self):
-        with open(self.filepath, 'wb') as f:
-            pickle.dump(self.users, f)
+        for username in self.users:
+            self._compact(username)
+        self._write_index()
 
     def add_user(self, user: User):
+        self._create_shard(user)
+        self._write_index()
+
+    def delete_user(self, username):
+        if username not in self.index:
+            return
+        for suffix in ('.pkl', JOURNAL_SUFFIX):
+            path = self._shard_path(username, suffix)
+            if path.exists():
+                path.unlink()
+        del self.index[username]
+        self._write_index()
+        self.users.pop(username, None)
+        self.journal_records.pop(username, None)
+
+    def record_answer(self, user, pid, genre=None):
+        stats = user.question_stats.get(pid)
+        card = user.schedule.get(pid)
+        # Kategorisummen lagres som absolutt verdi, som stats, så posten kan spilles av flere ganger
+        entry = user.genre_stats.get(str(genre)) if genre is not None else None
+        genre_entry = (str(genre), dict(entry)) if entry is not None else None
+        self._append(user, ("answer", user.username, pid, dict(stats), dict(card) if card else None, genre_entry))
+
+    def rebuild_genre_stats(self, user):
+        genre_stats, question_set = rebuild_genre_stats(user)
+        self._append(user, ("genre_stats", user.username, genre_stats, question_set))
+
+    def record_quiz(self, user, quiz):
+        self._append(user, ("quiz", user.username, quiz))
+
+    def delete_quiz(self, user, index):
+        self._append(user, ("delete_quiz", user.username, index))
+
+    def reset_stats(self, user):
+        self._append(user, ("reset_stats", user.username))
+
+    def update_profile(self, user, old_username=None):
+        old_username = old_username or user.username
+        # Et nytt navn som allerede finnes ville overskrevet den andre brukerens indeksoppføring
+        if user.username != old_username and user.username in self.index:
+            raise ValueError(f"Username '{user.username}' is already in use.")
+        fields = {
+            "name": user.name,
+            "password_hash": user.password_hash,
+            "current_question_set": user.current_question_set,
+        }
+
+        # Brukernavnet bor bare i indeksen; sharden beholder navnet sitt
+        entry = self.index.pop(old_username)
+        entry["password_hash"] = user.password_hash
+        self.index[user.username] = entry
+        self._write_index()
+
+        self.users.pop(old_username, None)
         self.users[user.username] = user
-        self.save()
+        self.journal_records[user.username] = self.journal_records.pop(old_username, 0)
+        self._append(user, ("profile", user.username, fields))
+
+    def password_hash(self, username):
+        entry = self.index.get(username)
+        return entry["password_hash"] if entry else None
 
     def get_user(self, username):
-        return self.users.get(username)
+        if username not in self.index:
+            return None
+        if username not in self.users:
+            self.users[username] = self._load_user(username)
+        return self.users[username]
     
     def user_exists(self, username):
-        return username in self.users
+        return username in self.index
+
+def open_user_database(backend=None):
+    backend = backend or USERDATA_BACKEND
+    if backend == "sqlite":
+        from code.userdb_sqlite import SQLiteUserDatabase
+        return SQLiteUserDatabase()
+    if backend != "pickle":
+        raise ValueError(f"Unknown user database backend: {backend}")
+    return UserDatabase()
 
 class UserSettingsPopup(QDialog):
     def __init__(self, user, user_db, parent=None):
@@ -169,20 +463,53 @@ class UserSettingsPopup(QDialog):
         self.setLayout(layout)
 
     def save_changes(self):
-        self.user.username = self.username_input.text()
-        self.user.name = self.name_input.text()
+        old_username = self.user.username
+        new_username = self.username_input.text().strip()
+        if not new_username:
+            QMessageBox.warning(self, "Invalid username", "Username cannot be empty.")
+            return
+        if new_username != old_username and self.user_db.user_exists(new_username):
+            QMessageBox.warning(self, "Username taken", "Username already in use.")
+            return
 
         new_password = self.password_input.text().strip()
         if new_password:
-            import bcrypt
-            hashed = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+            from code.passwords import hash_password, run_in_worker
+
+            # bcrypt kjører i bakgrunnen; dialogen er låst til hashen er klar
+            self.setEnabled(False)
+            self.setCursor(Qt.CursorShape.BusyCursor)
+            self.save_btn.setText("Saving…")
+            run_in_worker(hash_password, new_password,
+                          on_done=lambda hashed: self._finish_save(old_username, new_username, hashed))
+            return
+        self._finish_save(old_username, new_username)
+
+    def _finish_save(self, old_username, new_username, hashed=None):
+        self.setEnabled(True)
+        self.unsetCursor()
+        self.save_btn.setText("Save Changes")
+        if isinstance(hashed, Exception):
+            QMessageBox.critical(self, "Error", f"Could not change password: {hashed}")
+            return
+
+        # Brukeren endres først når alt er klart, så den aldri er ute av takt med indeksen
+        previous = (self.user.username, self.user.name, self.user.password_hash)
+        self.user.username = new_username
+        self.user.name = self.name_input.text()
+        if hashed is not None:
             self.user.password_hash = hashed
 
+        try:
+            self.user_db.update_profile(self.user, old_username)
+        except ValueError as e:
+            self.user.username, self.user.name, self.user.password_hash = previous
+            QMessageBox.warning(self, "Username taken", str(e))
+            return
+
         # Lagre OpenAI API-nøkkel til .env-fil
         api_key = self.api_key_input.text().strip()
         self._save_api_key_to_env(api_key)
-
-        self.user_db.save()
         self.accept()
 
     def _save_api_key_to_env(self, api_key):
@@ -223,7 +550,6 @@ class UserSettingsPopup(QDialog):
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            del self.user_db.users[self.user.username]
-            self.user_db.save()
+            self.user_db.delete_user(self.user.username)
             self.accept()
             self.parent().return_to_login()
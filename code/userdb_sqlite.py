@@ -0,0 +1,288 @@
+import pickle
+import sqlite3
+import sys
+from collections import defaultdict
+from pathlib import Path
+from code.genre_stats import rebuild_genre_stats
+from code.userdata import User, UserDatabase, USERDATA_DIR, default_stat, _fix_legacy_user
+
+USERDATA_DB = 'data/userdata.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    password_hash BLOB NOT NULL,
+    current_question_set TEXT
+);
+CREATE TABLE IF NOT EXISTS question_stats (
+    username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE ON UPDATE CASCADE,
+    pid INTEGER NOT NULL,
+    correct INTEGER NOT NULL DEFAULT 0,
+    wrong INTEGER NOT NULL DEFAULT 0,
+    last_timestamp REAL NOT NULL DEFAULT 0,
+    due REAL,
+    interval REAL,
+    ease REAL,
+    reps INTEGER,
+    PRIMARY KEY (username, pid)
+);
+CREATE TABLE IF NOT EXISTS quiz_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE ON UPDATE CASCADE,
+    date_taken TEXT,
+    grade TEXT,
+    num_questions INTEGER NOT NULL,
+    num_correct INTEGER NOT NULL,
+    quiz BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS genre_stats (
+    username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE ON UPDATE CASCADE,
+    genre TEXT NOT NULL,
+    question_set TEXT NOT NULL,
+    correct INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (username, genre)
+);
+CREATE INDEX IF NOT EXISTS idx_quiz_attempts_user ON quiz_attempts (username, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+CARD_FIELDS = ("due", "interval", "ease", "reps")
+
+
+class SQLiteUserDatabase:
+    """UserDatabase backend on the standard-library sqlite3.
+
+    Exposes the same methods as UserDatabase, but only the user who logs in
+    is read from disk, and each event is a single-row write. `users` holds
+    the users loaded so far in this session.
+    """
+
+    def __init__(self, filepath=USERDATA_DB, migrate_from=USERDATA_DIR):
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.filepath)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+        self.users = {}
+        # Posisjon i user.saved_quizzes -> rad-id i quiz_attempts
+        self._attempt_ids = {}
+
+        # Brukerne fra pickle-backenden leses inn til migreringen er fullført. Flagget i meta
+        # skrives i samme transaksjon som brukerne, så en avbrutt migrering prøves igjen neste gang
+        if migrate_from and not self._migrated():
+            self.migrate_from_pickle(migrate_from)
+
+    def _migrated(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'migrated'").fetchone()
+        if row is not None:
+            return True
+        # Databaser fra før meta-tabellen: migreringen gikk i én transaksjon, så brukere betyr at den ble fullført
+        if self.conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is not None:
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated', 'legacy')")
+            return True
+        return False
+
+    def migrate_from_pickle(self, pickle_dir=USERDATA_DIR):
+        source = UserDatabase(pickle_dir)
+        migrated = 0
+        try:
+            with self.conn:
+                for username in source.index:
+                    if not self.user_exists(username):
+                        self._insert_user(source.get_user(username))
+                        migrated += 1
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated', ?)", (str(Path(pickle_dir)),)
+                )
+        except Exception:
+            # Transaksjonen er rullet tilbake; glem rad-id-ene fra den
+            self._attempt_ids.clear()
+            raise
+        return migrated
+
+    def _insert_user(self, user):
+        self.conn.execute(
+            "INSERT INTO users (username, name, password_hash, current_question_set) VALUES (?, ?, ?, ?)",
+            (user.username, user.name, user.password_hash, user.current_question_set)
+        )
+        for pid in set(user.question_stats) | set(user.schedule):
+            self._write_stat(user, pid)
+        self._write_genre_stats(user)
+        self._attempt_ids[user.username] = [self._insert_quiz(user.username, quiz) for quiz in user.saved_quizzes]
+
+    def _insert_quiz(self, username, quiz):
+        cur = self.conn.execute(
+            "INSERT INTO quiz_attempts (username, date_taken, grade, num_questions, num_correct, quiz) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                username,
+                quiz.date_taken.isoformat() if getattr(quiz, "date_taken", None) else None,
+                quiz.grade,
+                len(quiz.results),
+                sum(quiz.results),
+                pickle.dumps(quiz, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+        )
+        return cur.lastrowid
+
+    def _write_stat(self, user, pid):
+        stats = user.question_stats.get(pid, default_stat())
+        card = user.schedule.get(pid) or {}
+        self.conn.execute(
+            "INSERT OR REPLACE INTO question_stats (username, pid, correct, wrong, last_timestamp, due, interval, ease, reps) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                user.username, pid, stats["correct"], stats["wrong"], stats.get("last_timestamp", 0),
+                *(card.get(field) for field in CARD_FIELDS),
+            )
+        )
+
+    def _write_genre_stat(self, user, genre):
+        entry = user.genre_stats[genre]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO genre_stats (username, genre, question_set, correct, total, last_seen) VALUES (?, ?, ?, ?, ?, ?)",
+            (user.username, genre, user.genre_stats_set, entry["correct"], entry["total"], entry["last_seen"])
+        )
+
+    def _write_genre_stats(self, user):
+        self.conn.execute("DELETE FROM genre_stats WHERE username = ?", (user.username,))
+        if user.genre_stats_set is not None:
+            for genre in user.genre_stats:
+                self._write_genre_stat(user, genre)
+
+    def _load_user(self, username):
+        row = self.conn.execute(
+            "SELECT name, password_hash, current_question_set FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            return None
+        name, password_hash, current_question_set = row
+
+        question_stats = defaultdict(default_stat)
+        schedule = {}
+        for pid, correct, wrong, last_timestamp, *card in self.conn.execute(
+            "SELECT pid, correct, wrong, last_timestamp, due, interval, ease, reps FROM question_stats WHERE username = ?",
+            (username,)
+        ):
+            question_stats[pid] = {"correct": correct, "wrong": wrong, "last_timestamp": last_timestamp}
+            if card[0] is not None:
+                schedule[pid] = dict(zip(CARD_FIELDS, card))
+
+        # Settet lagres per rad; ingen rader betyr at summene bygges på nytt ved første visning
+        genre_stats, genre_stats_set = {}, None
+        for genre, question_set, correct, total, last_seen in self.conn.execute(
+            "SELECT genre, question_set, correct, total, last_seen FROM genre_stats WHERE username = ?", (username,)
+        ):
+            genre_stats[genre] = {"correct": correct, "total": total, "last_seen": last_seen}
+            genre_stats_set = question_set
+
+        attempt_ids, saved_quizzes = [], []
+        for attempt_id, blob in self.conn.execute(
+            "SELECT id, quiz FROM quiz_attempts WHERE username = ? ORDER BY id", (username,)
+        ):
+            attempt_ids.append(attempt_id)
+            saved_quizzes.append(pickle.loads(blob))
+
+        user = _fix_legacy_user(User(name, username, password_hash, saved_quizzes, question_stats, current_question_set, schedule,
+                                     genre_stats, genre_stats_set))
+        self._attempt_ids[username] = attempt_ids
+        return user
+
+    def save(self):
+        # Alle hendelser er allerede skrevet; bare sørg for at WAL-en er flettet inn
+        self.conn.commit()
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def add_user(self, user: User):
+        with self.conn:
+            self._insert_user(user)
+        self.users[user.username] = user
+
+    def delete_user(self, username):
+        with self.conn:
+            self.conn.execute("DELETE FROM users WHERE username = ?", (username,))
+        self.users.pop(username, None)
+        self._attempt_ids.pop(username, None)
+
+    def record_answer(self, user, pid, genre=None):
+        with self.conn:
+            self._write_stat(user, pid)
+            if genre is not None and user.genre_stats_set is not None and str(genre) in user.genre_stats:
+                self._write_genre_stat(user, str(genre))
+
+    def rebuild_genre_stats(self, user):
+        user.genre_stats, user.genre_stats_set = rebuild_genre_stats(user)
+        with self.conn:
+            self._write_genre_stats(user)
+
+    def record_quiz(self, user, quiz):
+        user.add_quiz(quiz)
+        with self.conn:
+            attempt_id = self._insert_quiz(user.username, quiz)
+        self._attempt_ids.setdefault(user.username, []).append(attempt_id)
+
+    def delete_quiz(self, user, index):
+        attempt_id = self._attempt_ids[user.username].pop(index)
+        del user.saved_quizzes[index]
+        with self.conn:
+            self.conn.execute("DELETE FROM quiz_attempts WHERE id = ?", (attempt_id,))
+
+    def reset_stats(self, user):
+        user.question_stats.clear()
+        user.schedule.clear()
+        user.genre_stats.clear()
+        with self.conn:
+            self.conn.execute("DELETE FROM question_stats WHERE username = ?", (user.username,))
+            self.conn.execute("DELETE FROM genre_stats WHERE username = ?", (user.username,))
+
+    def update_profile(self, user, old_username=None):
+        old_username = old_username or user.username
+        if user.username != old_username and self.user_exists(user.username):
+            raise ValueError(f"Username '{user.username}' is already in use.")
+        with self.conn:
+            self.conn.execute(
+                "UPDATE users SET username = ?, name = ?, password_hash = ?, current_question_set = ? WHERE username = ?",
+                (user.username, user.name, user.password_hash, user.current_question_set, old_username)
+            )
+        if old_username != user.username:
+            self.users.pop(old_username, None)
+            self._attempt_ids[user.username] = self._attempt_ids.pop(old_username, [])
+        self.users[user.username] = user
+
+    def get_user(self, username):
+        if username not in self.users:
+            user = self._load_user(username)
+            if user is None:
+                return None
+            self.users[username] = user
+        return self.users[username]
+
+    def password_hash(self, username):
+        if username in self.users:
+            return self.users[username].password_hash
+        row = self.conn.execute("SELECT password_hash FROM users WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else None
+
+    def user_exists(self, username):
+        if username in self.users:
+            return True
+        return self.conn.execute("SELECT 1 FROM users WHERE username = ?", (username,)).fetchone() is not None
+
+
+if __name__ == "__main__":
+    # Engangsmigrering: python -m code.userdb_sqlite [data/users] [userdata.sqlite]
+    pickle_path = sys.argv[1] if len(sys.argv) > 1 else USERDATA_DIR
+    db_path = sys.argv[2] if len(sys.argv) > 2 else USERDATA_DB
+    if Path(db_path).exists():
+        sys.exit(f"{db_path} already exists")
+    db = SQLiteUserDatabase(db_path, migrate_from=None)
+    print(f"Migrated {db.migrate_from_pickle(pickle_path)} users from {pickle_path} to {db_path}")
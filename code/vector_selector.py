@@ -0,0 +1,96 @@
+import time
+import numpy as np
+from code.tier_index import TIERS, SKIP_ACCURACY, PRIORITY_ACCURACY, SKIP_SECONDS, genre_quotas
+
+
+class VectorSelector:
+    """NumPy variant of TierIndex with the same tiering rules.
+
+    Correct/wrong counts and last-seen timestamps are kept in arrays aligned
+    with the bank, and tiers are recomputed for the whole bank in one
+    vectorized pass per quiz instead of being maintained per answer.
+    """
+
+    def __init__(self, problems, question_stats):
+        self.problems = problems
+        self.stats = question_stats
+
+        n = len(problems)
+        self.correct = np.zeros(n, dtype=np.int32)
+        self.wrong = np.zeros(n, dtype=np.int32)
+        self.last_seen = np.zeros(n, dtype=np.float64)
+
+        self.genres = list({p.genre for p in problems})
+        genre_codes = {genre: code for code, genre in enumerate(self.genres)}
+        self.genre_code = np.fromiter((genre_codes[p.genre] for p in problems), dtype=np.int32, count=n)
+
+        self._positions_by_pid = {}
+        for idx, p in enumerate(problems):
+            self._positions_by_pid.setdefault(p.pid, []).append(idx)
+
+        for pid in self._positions_by_pid:
+            if pid in question_stats:
+                self.update(pid)
+
+    def update(self, pid, now=None):
+        stats = self.stats.get(pid)
+        if stats is None:
+            return
+        for idx in self._positions_by_pid.get(pid, ()):
+            self.correct[idx] = stats["correct"]
+            self.wrong[idx] = stats["wrong"]
+            self.last_seen[idx] = stats.get("last_timestamp", 0)
+
+    def tiers(self, now=None):
+        now = time.time() if now is None else now
+        total = self.correct + self.wrong
+        accuracy = np.divide(self.correct, total, out=np.full(len(total), 0.5), where=total > 0)
+        recent = (now - self.last_seen) < SKIP_SECONDS
+
+        # 0 = prioritized, 1 = neutral, 2 = skipped (samme rekkefølge som TIERS)
+        tier = np.ones(len(total), dtype=np.int32)
+        tier[accuracy < PRIORITY_ACCURACY] = 0
+        tier[(accuracy > SKIP_ACCURACY) & recent] = 2
+        return tier
+
+    def select(self, num_problems, genres=None, rng=None, now=None):
+        rng = np.random.default_rng() if rng is None else rng
+        tier = self.tiers(now)
+
+        if genres is None:
+            genres = [self.genres[i] for i in rng.permutation(len(self.genres))]
+        genre_counts = genre_quotas(genres, num_problems)
+        genre_codes = {genre: code for code, genre in enumerate(self.genres)}
+
+        # Sorter én gang etter (sjanger, tier) og del opp i bøtter
+        n_tiers = len(TIERS)
+        keys = self.genre_code * n_tiers + tier
+        order = np.argsort(keys, kind="stable")
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(keys, minlength=len(self.genres) * n_tiers))))
+
+        selected = []
+        used_pids = set()
+
+        for t in range(n_tiers):
+            for genre in genres:
+                remaining_slots = genre_counts[genre]
+                if remaining_slots <= 0:
+                    continue
+                key = genre_codes[genre] * n_tiers + t
+                bucket = order[bounds[key]:bounds[key + 1]]
+                n = min(len(bucket), remaining_slots)
+                for idx in rng.choice(bucket, n, replace=False):
+                    p = self.problems[idx]
+                    if p.pid in used_pids:
+                        continue
+                    used_pids.add(p.pid)
+                    selected.append(p)
+                    genre_counts[genre] -= 1
+
+        # Hvis fortsatt ikke nok spørsmål, fyll tilfeldig
+        if len(selected) < num_problems:
+            remaining_problems = [p for p in self.problems if p.pid not in used_pids]
+            for idx in rng.permutation(len(remaining_problems))[:num_problems - len(selected)]:
+                selected.append(remaining_problems[idx])
+
+        return genres, selected
@@ -0,0 +1,128 @@
+import json
+import mimetypes
+from pathlib import Path
+from PyQt6.QtCore import QBuffer, QByteArray, QUrl
+from PyQt6.QtWebEngineCore import (
+    QWebEngineProfile, QWebEnginePage, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob
+)
+
+SCHEME = b"quizml"
+# Base-URL for alle sider, slik at quizml://-ressurser kan lastes uten nettverk
+APP_URL = QUrl("quizml://app/")
+MATHJAX_URL = "quizml://app/mathjax/tex-mml-chtml.js"
+
+ASSET_ROOTS = {
+    "mathjax": Path(__file__).parent / "assets" / "mathjax",
+    "images": Path("images"),
+}
+
+# Leses inn i minnet ved oppstart (se code.startup), før første side ber om dem
+WARM_ASSETS = ("mathjax/tex-mml-chtml.js", "mathjax/output/chtml/fonts/woff-v2")
+
+DEFAULT_MATHJAX_CONFIG = {
+    "tex": {"inlineMath": [["$", "$"]]},
+    "svg": {"fontCache": "global"},
+}
+
+_profile = None
+_handler = None
+# url-sti -> (mime, QByteArray); delt av handleren og preload_assets()
+_asset_cache = {}
+
+
+def register_scheme():
+    # Må kalles før QApplication opprettes
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+        | QWebEngineUrlScheme.Flag.CorsEnabled
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def _resolve(url_path):
+    root_name, _, rel_path = url_path.lstrip("/").partition("/")
+    root = ASSET_ROOTS.get(root_name)
+    if root is None or not rel_path:
+        return None
+    root = root.resolve()
+    path = (root / rel_path).resolve()
+    if root not in path.parents or not path.is_file():
+        return None
+    return path
+
+
+def load_asset(url_path):
+    entry = _asset_cache.get(url_path)
+    if entry is None:
+        path = _resolve(url_path)
+        if path is None:
+            return None
+        mime = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        entry = _asset_cache[url_path] = (mime.encode(), QByteArray(path.read_bytes()))
+    return entry
+
+
+def preload_assets(rel_paths=WARM_ASSETS):
+    # Trygt å kalle fra en bakgrunnstråd; gir (antall filer, bytes)
+    count = size = 0
+    for rel_path in rel_paths:
+        root_name, _, rest = rel_path.partition("/")
+        base = ASSET_ROOTS[root_name] / rest
+        files = sorted(base.rglob("*")) if base.is_dir() else [base]
+        for path in files:
+            if not path.is_file():
+                continue
+            entry = load_asset(f"/{root_name}/{path.relative_to(ASSET_ROOTS[root_name]).as_posix()}")
+            if entry is not None:
+                count += 1
+                size += entry[1].size()
+    return count, size
+
+
+class AssetSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves quizml://app/<root>/<path> from the bundled asset folders.
+
+    Files are read from disk once and kept in memory for the rest of the
+    session, so every view after the first gets MathJax straight from RAM.
+    """
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob):
+        entry = load_asset(job.requestUrl().path())
+        if entry is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        mime, data = entry
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        job.reply(mime, buffer)
+
+
+def shared_profile():
+    global _profile, _handler
+    if _profile is None:
+        _profile = QWebEngineProfile("quizml")
+        _handler = AssetSchemeHandler(_profile)
+        _profile.installUrlSchemeHandler(SCHEME, _handler)
+    return _profile
+
+
+def new_view(parent=None):
+    # QtWebEngineWidgets lastes først når det trengs; AA_ShareOpenGLContexts er satt i QuizML.py
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+    view = QWebEngineView(parent)
+    view.setPage(QWebEnginePage(shared_profile(), view))
+    return view
+
+
+def mathjax_head(config=None):
+    return f"""
+        <script>
+            window.MathJax = {json.dumps(config or DEFAULT_MATHJAX_CONFIG)};
+        </script>
+        <script type='text/javascript' id='MathJax-script' async src='{MATHJAX_URL}'></script>
+    """
@@ -0,0 +1,27 @@
+import threading
+import pytest
+from code.hint_store import HintStore
+from code.mock_hint_server import MockHintServer
+
+
+@pytest.fixture
+def mock_server():
+    # Starter MockHintServer på en ledig port; alle stoppes når testen er ferdig
+    servers = []
+
+    def start(**kwargs):
+        kwargs.setdefault("token_delay", 0.0)
+        server = MockHintServer(0, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HintStore(tmp_path / "hints.sqlite")
@@ -0,0 +1,98 @@
+import threading
+from PyQt6.QtCore import Qt
+from code.hints import HintRequest, problem_hint_key
+from code.mock_hint_server import CANNED_HINT
+from code.problem import Problem
+
+DIRECT = Qt.ConnectionType.DirectConnection
+PROBLEM = Problem(1, "What does the loss measure?", "", [f"alt {i}" for i in range(5)], "_alt1", "1")
+
+
+def record(request):
+    # DirectConnection: signalene leveres i tråden som kjører run(), uten event-løkke
+    events = []
+    request.signals.chunk.connect(lambda text: events.append(("chunk", text)), DIRECT)
+    request.signals.finished.connect(lambda text: events.append(("finished", text)), DIRECT)
+    request.signals.failed.connect(lambda text: events.append(("failed", text)), DIRECT)
+    return events
+
+
+def test_stream_emits_chunks_then_full_hint(mock_server, store):
+    server = mock_server()
+    request = HintRequest(PROBLEM, "test", timeout=5, store=store, stream=True, base_url=server.base_url)
+    events = record(request)
+
+    request.run()
+
+    chunks = [text for kind, text in events if kind == "chunk"]
+    assert len(chunks) > 1
+    assert "".join(chunks).strip() == CANNED_HINT
+    assert events[-1] == ("finished", CANNED_HINT)
+    assert store.get(problem_hint_key(PROBLEM)) == CANNED_HINT
+
+
+def test_non_streaming_emits_only_finished(mock_server, store):
+    server = mock_server()
+    request = HintRequest(PROBLEM, "test", timeout=5, store=store, stream=False, base_url=server.base_url)
+    events = record(request)
+
+    request.run()
+
+    assert events == [("finished", CANNED_HINT)]
+    assert server.received == 1
+    assert store.get(problem_hint_key(PROBLEM)) == CANNED_HINT
+
+
+def test_cancel_from_other_thread_mid_stream(mock_server, store):
+    # Som i dialogen: forespørselen går i en arbeidstråd og avbrytes utenfra mens teksten strømmer inn
+    server = mock_server(token_delay=0.05)
+    request = HintRequest(PROBLEM, "test", timeout=5, store=store, stream=True, base_url=server.base_url)
+    events = record(request)
+    first_chunk = threading.Event()
+    request.signals.chunk.connect(lambda text: first_chunk.set(), DIRECT)
+
+    worker = threading.Thread(target=request.run)
+    worker.start()
+    assert first_chunk.wait(5)
+    request.cancel()
+    worker.join(5)
+
+    assert not worker.is_alive()
+    kinds = [kind for kind, _ in events]
+    assert "chunk" in kinds
+    assert "finished" not in kinds and "failed" not in kinds
+    assert problem_hint_key(PROBLEM) not in store
+
+
+def test_cancel_mid_stream_emits_nothing_more_and_stores_nothing(mock_server, store):
+    server = mock_server(token_delay=0.02)
+    request = HintRequest(PROBLEM, "test", timeout=5, store=store, stream=True, base_url=server.base_url)
+    events = record(request)
+    request.signals.chunk.connect(lambda text: request.cancel())
+
+    request.run()
+
+    assert request.cancelled
+    assert [kind for kind, _ in events] == ["chunk"]
+    assert problem_hint_key(PROBLEM) not in store
+
+
+def test_server_error_emits_failed(mock_server, store):
+    server = mock_server(fail_rate=1.0)
+    request = HintRequest(PROBLEM, "test", timeout=5, store=store, stream=True, base_url=server.base_url)
+    events = record(request)
+
+    request.run()
+
+    assert events == [("failed", "Hint not received. Please try again.")]
+    assert problem_hint_key(PROBLEM) not in store
+
+
+def test_timeout_emits_failed(mock_server):
+    server = mock_server(delay=1.0)
+    request = HintRequest(PROBLEM, "test", timeout=0.2, stream=True, base_url=server.base_url)
+    events = record(request)
+
+    request.run()
+
+    assert events == [("failed", "The hint request timed out. Please try again.")]
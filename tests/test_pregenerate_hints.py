@@ -0,0 +1,60 @@
+import asyncio
+import random
+from code import pregenerate_hints
+from code.hints import problem_hint_key
+from code.mock_hint_server import CANNED_HINT
+from code.pregenerate_hints import generate_hints, pending_problems
+from code.problem import Problem
+
+
+def make_problems(count):
+    return [
+        Problem(pid, f"Question {pid}?", "", [f"alt {pid}.{i}" for i in range(5)], "_alt1", "1")
+        for pid in range(count)
+    ]
+
+
+def run(problems, store, server, **kwargs):
+    kwargs.setdefault("rate", 0)
+    return asyncio.run(generate_hints(problems, store, "test", base_url=server.base_url, timeout=5, **kwargs))
+
+
+def test_retries_with_backoff_end_in_stored_hints(mock_server, store, monkeypatch):
+    monkeypatch.setattr(pregenerate_hints, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(pregenerate_hints, "MAX_RETRIES", 20)
+    random.seed(1)
+    server = mock_server(fail_rate=0.5)
+    problems = make_problems(12)
+
+    stats = run(problems, store, server)
+
+    assert stats["failed"] == 0
+    assert stats["done"] == len(problems)
+    assert stats["retries"] > 0
+    assert server.received == len(problems) + stats["retries"]
+    assert all(store.get(problem_hint_key(p)) == CANNED_HINT for p in problems)
+
+
+def test_rerun_skips_stored_keys(mock_server, store):
+    server = mock_server()
+    problems = make_problems(10)
+
+    run(problems[:4], store, server)
+    assert server.received == 4
+
+    pending = pending_problems(problems, store)
+    assert [p.pid for p in pending] == [p.pid for p in problems[4:]]
+
+    run(pending, store, server)
+    assert server.received == len(problems)
+    assert len(store) == len(problems)
+    assert pending_problems(problems, store) == []
+
+
+def test_concurrency_limit(mock_server, store):
+    server = mock_server(delay=0.1)
+
+    stats = run(make_problems(8), store, server, concurrency=2)
+
+    assert stats["done"] == 8
+    assert server.max_in_flight == 2